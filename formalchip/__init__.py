@@ -1,6 +1,16 @@
 """FormalChip package."""
 
-from .loop import run_formalchip
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["run_formalchip"]
 
+
+def __getattr__(name: str) -> Any:
+    # Resolve the loop lazily so `import formalchip.cli` stays cheap.
+    if name == "run_formalchip":
+        from .loop import run_formalchip
+
+        return run_formalchip
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
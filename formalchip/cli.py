@@ -1,376 +1,315 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import sys
 from pathlib import Path
+from typing import Callable
 
-from .config import load_config
-from .doctor import format_doctor_report, run_doctor
-from .evidence import build_evidence_pack
-from .kpi import compute_kpi_report
-from .loop import run_formalchip
-from .pipeline import build_initial_synthesis
-from .pilot import scaffold_open_source_pilot
-from .reporting import load_gate_verdict, load_report
-from .synthesis import is_placeholder_candidate, write_candidate_file
-from .templates import export_engine_template, supported_engine_templates
-from .util import write_json
 
+def _configure_init(p: argparse.ArgumentParser) -> None:
+    p.add_argument("path", nargs="?", default=".", help="Target directory")
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(prog="formalchip", description="FormalChip verification acceleration loop")
-    sub = parser.add_subparsers(dest="cmd", required=True)
 
-    p_init = sub.add_parser("init", help="Create a starter FormalChip project")
-    p_init.add_argument("path", nargs="?", default=".", help="Target directory")
+def _cmd_init(args: argparse.Namespace) -> int:
+    from .starter import scaffold_starter_project
 
-    p_pilot = sub.add_parser(
-        "pilot-init",
-        help="Scaffold an open-source pilot package (RTL + canonical 10 properties + CI/evidence layout)",
-    )
-    p_pilot.add_argument("path", nargs="?", default="examples/open-pilot", help="Target directory")
+    target = Path(args.path).resolve()
+    scaffold_starter_project(target)
+    print(f"Initialized FormalChip project at {target}")
+    return 0
 
-    p_engine = sub.add_parser("engine-template", help="Export vendor engine integration template script")
-    p_engine.add_argument("--engine", required=True, help="Engine kind: vcformal | jasper | questa")
-    p_engine.add_argument("--out", required=False, help="Output script path")
 
-    p_doctor = sub.add_parser("doctor", help="Validate config/tooling and preview synthesis quality")
-    p_doctor.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
+def _configure_pilot_init(p: argparse.ArgumentParser) -> None:
+    p.add_argument("path", nargs="?", default="examples/open-pilot", help="Target directory")
 
-    p_synth = sub.add_parser("synth", help="Generate candidate properties without running a formal engine")
-    p_synth.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
-    p_synth.add_argument("--out", required=False, help="Output property file (.sv)")
-    p_synth.add_argument("--summary-json", required=False, help="Optional summary JSON output")
-    p_synth.add_argument(
-        "--deterministic",
-        action="store_true",
-        help="Force deterministic/template synthesis even if llm.backend=command",
-    )
 
-    p_run = sub.add_parser("run", help="Run proposal->formal->repair loop")
-    p_run.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
-    p_run.add_argument("--max-iters", type=int, default=None, help="Override max iterations")
-    p_run.add_argument("--skip-doctor", action="store_true", help="Skip doctor preflight before run")
+def _cmd_pilot_init(args: argparse.Namespace) -> int:
+    from .pilot import scaffold_open_source_pilot
 
-    p_ev = sub.add_parser("evidence", help="Build evidence pack for an existing run dir")
-    p_ev.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
-    p_ev.add_argument("--config", required=False, help="Config path used for the run")
-    p_ev.add_argument("--out", required=False, help="Output tar.gz path")
+    target = Path(args.path).resolve()
+    scaffold_open_source_pilot(target)
+    print(f"Initialized open-source pilot at {target}")
+    return 0
 
-    p_report = sub.add_parser("report", help="Print run summary report")
-    p_report.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
-    p_report.add_argument("--format", choices=["text", "json"], default="text")
-    p_report.add_argument("--include-gate", action="store_true", help="Include gate verdict in output")
 
-    p_kpi = sub.add_parser("kpi", help="Generate KPI report for a run")
-    p_kpi.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
-    p_kpi.add_argument("--config", required=False, help="Optional config path (for KPI policy)")
-    p_kpi.add_argument("--baseline-csv", required=False, help="Optional baseline study CSV")
-    p_kpi.add_argument("--format", choices=["text", "json"], default="text")
+def _configure_engine_template(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--engine", required=True, help="Engine kind: vcformal | jasper | questa")
+    p.add_argument("--out", required=False, help="Output script path")
 
-    args = parser.parse_args(argv)
 
-    if args.cmd == "init":
-        _init_project(Path(args.path).resolve())
-        return 0
+def _cmd_engine_template(args: argparse.Namespace) -> int:
+    from .templates import export_engine_template, supported_engine_templates
 
-    if args.cmd == "pilot-init":
-        target = Path(args.path).resolve()
-        scaffold_open_source_pilot(target)
-        print(f"Initialized open-source pilot at {target}")
-        return 0
+    supported = supported_engine_templates()
+    engine = args.engine.lower().strip()
+    if engine not in supported:
+        print(f"Unsupported engine template: {engine}")
+        print(f"supported={','.join(supported)}")
+        return 2
+    out = Path(args.out).resolve() if args.out else Path.cwd() / f"{engine}.run.tcl"
+    export_engine_template(engine=engine, output_path=out)
+    print(out)
+    return 0
 
-    if args.cmd == "engine-template":
-        supported = supported_engine_templates()
-        engine = args.engine.lower().strip()
-        if engine not in supported:
-            print(f"Unsupported engine template: {engine}")
-            print(f"supported={','.join(supported)}")
-            return 2
-        out = Path(args.out).resolve() if args.out else Path.cwd() / f"{engine}.run.tcl"
-        export_engine_template(engine=engine, output_path=out)
-        print(out)
-        return 0
 
-    if args.cmd == "doctor":
-        cfg = load_config(args.config)
-        report = run_doctor(cfg)
-        print(format_doctor_report(report))
-        return 0 if report.ok else 2
-
-    if args.cmd == "synth":
-        cfg = load_config(args.config)
-        init = build_initial_synthesis(cfg, force_deterministic=args.deterministic)
-
-        out = Path(args.out).resolve() if args.out else (cfg.config_path.parent / ".formalchip" / "preview" / "properties.sv")
-        write_candidate_file(out, init.candidates)
-
-        placeholder_count = sum(1 for c in init.candidates if is_placeholder_candidate(c))
-        summary = {
-            "config": str(cfg.config_path),
-            "clauses": len(init.clauses),
-            "known_signals": len(init.inputs.known_signals),
-            "candidates": len(init.candidates),
-            "placeholders": placeholder_count,
-            "output": str(out),
-        }
-
-        if args.summary_json:
-            write_json(Path(args.summary_json).resolve(), summary)
-
-        print(f"output={summary['output']}")
-        print(f"clauses={summary['clauses']}")
-        print(f"candidates={summary['candidates']}")
-        print(f"placeholders={summary['placeholders']}")
-        return 0
+def _configure_doctor(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
+    p.add_argument("--fast", action="store_true", help="Check config/tooling only; skip the synthesis preflight")
 
-    if args.cmd == "run":
-        cfg = load_config(args.config)
-        if not args.skip_doctor:
-            report = run_doctor(cfg)
-            if not report.ok:
-                print(format_doctor_report(report))
-                return 2
-            if report.warnings:
-                print(format_doctor_report(report))
-
-        state = run_formalchip(cfg, max_iterations_override=args.max_iters)
-        print(f"run_id={state.run_id}")
-        print(f"status={state.status}")
-        print(f"iterations={len(state.iterations)}")
-        if state.reports:
-            print(f"summary_json={state.reports.get('json', '')}")
-            print(f"summary_md={state.reports.get('markdown', '')}")
-            print(f"gate_json={state.reports.get('gate', '')}")
-        if state.evidence_pack:
-            print(f"evidence_pack={state.evidence_pack}")
-        return 0 if state.status == "pass" else 1
-
-    if args.cmd == "evidence":
-        run_dir = Path(args.run_dir).resolve()
-        if args.config:
-            config_path = Path(args.config).resolve()
-        else:
-            state_path = run_dir / "state.json"
-            if not state_path.exists():
-                raise FileNotFoundError("--config is required when state.json is not present")
-
-            state = json.loads(state_path.read_text(encoding="utf-8"))
-            config_path = Path(state["config_path"])
-
-        out = Path(args.out).resolve() if args.out else None
-        pack = build_evidence_pack(run_dir=run_dir, config_path=config_path, tool_versions={}, output_path=out)
-        print(pack)
-        return 0
 
-    if args.cmd == "report":
-        run_dir = Path(args.run_dir).resolve()
-        summary = load_report(run_dir)
-        gate = load_gate_verdict(run_dir) if args.include_gate else None
-        if args.format == "json":
-            payload = {"summary": summary}
-            if gate is not None:
-                payload["gate_verdict"] = gate
-            print(json.dumps(payload if gate is not None else summary, indent=2, sort_keys=True))
-        else:
-            for key in [
-                "run_id",
-                "status",
-                "iterations",
-                "failed_property_count",
-                "counterexample_lines",
-                "coverage_hits",
-                "artifact_files",
-                "unsat_hints",
-                "evidence_pack",
-            ]:
-                print(f"{key}={summary.get(key)}")
-            if gate is not None:
-                print(f"gate_passed={gate.get('passed')}")
-        return 0
+def _cmd_doctor(args: argparse.Namespace) -> int:
+    from .config import load_config
+    from .doctor import format_doctor_report, run_doctor
 
-    if args.cmd == "kpi":
-        run_dir = Path(args.run_dir).resolve()
-        policy = None
-        if args.config:
-            policy = load_config(args.config).kpi
-        baseline = Path(args.baseline_csv).resolve() if args.baseline_csv else None
-        report = compute_kpi_report(run_dir=run_dir, policy=policy, baseline_csv=baseline)
-        if args.format == "json":
-            print(json.dumps(report, indent=2, sort_keys=True))
-        else:
-            print(f"run_id={report.get('run_id')}")
-            print(f"overall_success={report.get('overall_success')}")
-            print(f"bug_or_coverage_achieved={report.get('bug_or_coverage_achieved')}")
-            print(f"time_to_first_meaningful_properties_min={report.get('time_to_first_meaningful_properties_min')}")
-            print(f"meets_time_reduction_target={report.get('meets_time_reduction_target')}")
-            print(f"output={report.get('output')}")
-        return 0
+    cfg = load_config(args.config)
+    report = run_doctor(cfg, deep=not args.fast)
+    print(format_doctor_report(report))
+    return 0 if report.ok else 2
 
-    return 2
-
-
-def _init_project(target: Path) -> None:
-    target.mkdir(parents=True, exist_ok=True)
-    (target / "rtl").mkdir(parents=True, exist_ok=True)
-    (target / "spec").mkdir(parents=True, exist_ok=True)
-
-    _write_if_missing(
-        target / "formalchip.toml",
-        """[project]
-name = "pilot-control"
-rtl_files = ["rtl/top.sv"]
-top_module = "top"
-clock = "clk"
-reset = "rst_n"
-reset_active_low = true
-signal_aliases = { request = "req", acknowledge = "ack" }
-
-[llm]
-backend = "deterministic"
-model = "formalchip-template-v1"
-
-[engine]
-# Use `symbiyosys` for real proofs if installed. `mock` is CI-safe.
-kind = "mock"
-pass_after = 2
-# command = "sby"
-# sby_file = "formal/top.sby"
-
-[loop]
-max_iterations = 3
-workdir = ".formalchip/runs"
-
-[[specs]]
-kind = "text"
-path = "spec/control_logic.md"
-
-[[specs]]
-kind = "register_csv"
-path = "spec/registers.csv"
-signal_template = "{name_lower}_q"
-sw_we_signal = "sw_we"
-sw_addr_signal = "sw_addr"
-sw_addr_width = 32
-
-[[specs]]
-kind = "rule_table_csv"
-path = "spec/protocol_rules.csv"
-
-[[libraries]]
-kind = "handshake"
-req = "req"
-ack = "ack"
-bound = 4
-
-[[libraries]]
-kind = "fifo_safety"
-full = "fifo_full"
-empty = "fifo_empty"
-push = "fifo_push"
-pop = "fifo_pop"
-
-[[libraries]]
-kind = "reset_sequence"
-signal = "valid"
-value = "1'b0"
-latency = 1
-
-[[libraries]]
-kind = "inline"
-name = "ctrl_write_decode_valid"
-expr = "(sw_we && (sw_addr == 32'h00000004)) |-> !fifo_full"
-property_kind = "assert"
-
-[constraints]
-assumptions = [
-  { name = "env_no_push_and_pop_when_empty", expr = "!(fifo_push && fifo_pop && fifo_empty)", note = "Environment sanity assumption" }
-]
-covers = [
-  { name = "cover_req_ack", expr = "req ##[1:4] ack", note = "Observe at least one handshake sequence" }
-]
-
-[kpi]
-min_time_reduction_percent = 30.0
-require_bug_or_coverage = true
-""",
-    )
 
-    _write_if_missing(
-        target / "rtl" / "top.sv",
-        """module top(
-  input  logic        clk,
-  input  logic        rst_n,
-  input  logic        req,
-  output logic        ack,
-  input  logic        fifo_push,
-  input  logic        fifo_pop,
-  output logic        fifo_full,
-  output logic        fifo_empty,
-  output logic        valid,
-  input  logic        sw_we,
-  input  logic [31:0] sw_addr,
-  input  logic [31:0] sw_wdata
-);
-
-  logic [31:0] status_q;
-  logic [31:0] ctrl_q;
-
-  always_ff @(posedge clk or negedge rst_n) begin
-    if (!rst_n) begin
-      status_q <= 32'h0;
-      ctrl_q <= 32'h0;
-      ack <= 1'b0;
-      valid <= 1'b0;
-    end else begin
-      ack <= req;
-      valid <= !fifo_empty;
-
-      // CTRL register write at 0x04
-      if (sw_we && (sw_addr == 32'h00000004)) begin
-        ctrl_q <= sw_wdata;
-      end
-    end
-  end
-
-  assign fifo_full = 1'b0;
-  assign fifo_empty = 1'b1;
-endmodule
-""",
+def _configure_synth(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
+    p.add_argument("--out", required=False, help="Output property file (.sv)")
+    p.add_argument("--summary-json", required=False, help="Optional summary JSON output")
+    p.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Force deterministic/template synthesis even if llm.backend=command",
     )
 
-    _write_if_missing(
-        target / "spec" / "control_logic.md",
-        """# Control Logic Intent
 
-- If req then ack next cycle.
-- Never fifo_push and fifo_full.
-- valid should be low right after reset.
-""",
-    )
+def _cmd_synth(args: argparse.Namespace) -> int:
+    from .config import load_config
+    from .pipeline import build_initial_synthesis
+    from .synthesis import is_placeholder_candidate, write_candidate_file
+    from .util import write_json
 
-    _write_if_missing(
-        target / "spec" / "registers.csv",
-        """name,address,width,reset,access
-STATUS,0x00,32,0x0,ro
-CTRL,0x04,32,0x0,rw
-""",
-    )
+    cfg = load_config(args.config)
+    init = build_initial_synthesis(cfg, force_deterministic=args.deterministic)
 
-    _write_if_missing(
-        target / "spec" / "protocol_rules.csv",
-        """rule_id,condition,guarantee
-R1,req,ack
-R2,fifo_full,!fifo_push
-R3,fifo_empty,!fifo_pop
-""",
-    )
+    out = Path(args.out).resolve() if args.out else (cfg.config_path.parent / ".formalchip" / "preview" / "properties.sv")
+    write_candidate_file(out, init.candidates)
 
-    print(f"Initialized FormalChip project at {target}")
+    placeholder_count = sum(1 for c in init.candidates if is_placeholder_candidate(c))
+    summary = {
+        "config": str(cfg.config_path),
+        "clauses": len(init.clauses),
+        "known_signals": len(init.inputs.known_signals),
+        "candidates": len(init.candidates),
+        "placeholders": placeholder_count,
+        "output": str(out),
+    }
+
+    if args.summary_json:
+        write_json(Path(args.summary_json), summary)
+
+    print(f"output={summary['output']}")
+    print(f"clauses={summary['clauses']}")
+    print(f"candidates={summary['candidates']}")
+    print(f"placeholders={summary['placeholders']}")
+    return 0
+
+
+def _configure_run(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--config", required=True, help="Path to formalchip config (toml/json/yaml)")
+    p.add_argument("--max-iters", type=int, default=None, help="Override max iterations")
+    p.add_argument("--skip-doctor", action="store_true", help="Skip doctor preflight before run")
 
 
-def _write_if_missing(path: Path, content: str) -> None:
-    if path.exists():
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+def _cmd_run(args: argparse.Namespace) -> int:
+    from .config import load_config
+    from .doctor import format_doctor_report, run_doctor
+    from .loop import run_formalchip
+
+    cfg = load_config(args.config)
+    if not args.skip_doctor:
+        report = run_doctor(cfg)
+        if not report.ok:
+            print(format_doctor_report(report))
+            return 2
+        if report.warnings:
+            print(format_doctor_report(report))
+
+    state = run_formalchip(cfg, max_iterations_override=args.max_iters)
+    print(f"run_id={state.run_id}")
+    print(f"status={state.status}")
+    print(f"iterations={len(state.iterations)}")
+    if state.reports:
+        print(f"summary_json={state.reports.get('json', '')}")
+        print(f"summary_md={state.reports.get('markdown', '')}")
+        print(f"gate_json={state.reports.get('gate', '')}")
+    if state.evidence_pack:
+        print(f"evidence_pack={state.evidence_pack}")
+    return 0 if state.status == "pass" else 1
+
+
+def _configure_evidence(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
+    p.add_argument("--config", required=False, help="Config path used for the run")
+    p.add_argument("--out", required=False, help="Output tar.gz path")
+
+
+def _cmd_evidence(args: argparse.Namespace) -> int:
+    from .evidence import build_evidence_pack
+    from .util import read_json
+
+    # build_evidence_pack canonicalizes run_dir and the output path itself.
+    run_dir = Path(args.run_dir)
+    if args.config:
+        config_path = Path(args.config).resolve()
+    else:
+        state_path = run_dir / "state.json"
+        if not state_path.exists():
+            raise FileNotFoundError("--config is required when state.json is not present")
+
+        state = read_json(state_path)
+        config_path = Path(state["config_path"])
+
+    out = Path(args.out) if args.out else None
+    pack = build_evidence_pack(run_dir=run_dir, config_path=config_path, tool_versions={}, output_path=out)
+    print(pack)
+    return 0
+
+
+def _configure_report(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    p.add_argument("--include-gate", action="store_true", help="Include gate verdict in output")
+
+
+def _cmd_report(args: argparse.Namespace) -> int:
+    from .reporting import load_gate_verdict, load_report
+
+    run_dir = Path(args.run_dir)
+    summary = load_report(run_dir)
+    gate = load_gate_verdict(run_dir) if args.include_gate else None
+    if args.format == "json":
+        payload = {"summary": summary}
+        if gate is not None:
+            payload["gate_verdict"] = gate
+        print(json.dumps(payload if gate is not None else summary, indent=2, sort_keys=True))
+    else:
+        for key in [
+            "run_id",
+            "status",
+            "iterations",
+            "failed_property_count",
+            "counterexample_lines",
+            "coverage_hits",
+            "artifact_files",
+            "unsat_hints",
+            "evidence_pack",
+        ]:
+            print(f"{key}={summary.get(key)}")
+        if gate is not None:
+            print(f"gate_passed={gate.get('passed')}")
+    return 0
+
+
+def _configure_kpi(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--run-dir", required=True, help="Run directory (.formalchip/runs/<run-id>)")
+    p.add_argument("--config", required=False, help="Optional config path (for KPI policy)")
+    p.add_argument("--baseline-csv", required=False, help="Optional baseline study CSV")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+
+
+def _cmd_kpi(args: argparse.Namespace) -> int:
+    from .config import load_config
+    from .kpi import compute_kpi_report
+
+    run_dir = Path(args.run_dir)
+    policy = None
+    if args.config:
+        policy = load_config(args.config).kpi
+    baseline = Path(args.baseline_csv) if args.baseline_csv else None
+    report = compute_kpi_report(run_dir=run_dir, policy=policy, baseline_csv=baseline)
+    if args.format == "json":
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(f"run_id={report.get('run_id')}")
+        print(f"overall_success={report.get('overall_success')}")
+        print(f"bug_or_coverage_achieved={report.get('bug_or_coverage_achieved')}")
+        print(f"time_to_first_meaningful_properties_min={report.get('time_to_first_meaningful_properties_min')}")
+        print(f"meets_time_reduction_target={report.get('meets_time_reduction_target')}")
+        print(f"output={report.get('output')}")
+    return 0
+
+
+# Subcommand registry: name -> (help, configure, handler). Only the requested
+# subcommand gets its options registered; the rest are help-only stubs.
+_Configure = Callable[[argparse.ArgumentParser], None]
+_Handler = Callable[[argparse.Namespace], int]
+
+_COMMANDS: dict[str, tuple[str, _Configure, _Handler]] = {
+    "init": ("Create a starter FormalChip project", _configure_init, _cmd_init),
+    "pilot-init": (
+        "Scaffold an open-source pilot package (RTL + canonical 10 properties + CI/evidence layout)",
+        _configure_pilot_init,
+        _cmd_pilot_init,
+    ),
+    "engine-template": (
+        "Export vendor engine integration template script",
+        _configure_engine_template,
+        _cmd_engine_template,
+    ),
+    "doctor": ("Validate config/tooling and preview synthesis quality", _configure_doctor, _cmd_doctor),
+    "synth": ("Generate candidate properties without running a formal engine", _configure_synth, _cmd_synth),
+    "run": ("Run proposal->formal->repair loop", _configure_run, _cmd_run),
+    "evidence": ("Build evidence pack for an existing run dir", _configure_evidence, _cmd_evidence),
+    "report": ("Print run summary report", _configure_report, _cmd_report),
+    "kpi": ("Generate KPI report for a run", _configure_kpi, _cmd_kpi),
+}
+
+
+_DESCRIPTION = "FormalChip verification acceleration loop"
+
+
+def _top_level_help() -> str:
+    # Rendered straight from the registry so `formalchip --help` skips argparse entirely.
+    width = max(len(name) for name in _COMMANDS) + 2
+    lines = [
+        f"usage: formalchip [-h] {{{','.join(_COMMANDS)}}} ...",
+        "",
+        _DESCRIPTION,
+        "",
+        "commands:",
+    ]
+    lines.extend(f"  {name:<{width}}{help_text}" for name, (help_text, _, _) in _COMMANDS.items())
+    lines.extend(["", "Run 'formalchip <command> -h' for command options."])
+    return "\n".join(lines)
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    # The top-level parser only takes -h/--help, so the first positional is the subcommand.
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in _COMMANDS else None
+    return None
+
+
+# One parser per requested subcommand (at most len(_COMMANDS) + 1); parse_args
+# leaves it untouched, so embedded callers of main() reuse it.
+@functools.lru_cache(maxsize=None)
+def _build_parser(cmd: str | None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="formalchip", description=_DESCRIPTION)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    for name, (help_text, configure, _) in _COMMANDS.items():
+        p = sub.add_parser(name, help=help_text)
+        if name == cmd:
+            configure(p)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv in (["-h"], ["--help"]):
+        print(_top_level_help())
+        return 0
+    parser = _build_parser(_requested_command(argv))
+    args = parser.parse_args(argv)
+
+    _, _, handler = _COMMANDS[args.cmd]
+    return handler(args)
@@ -3,12 +3,12 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import tomllib
+from .util import parse_file_cached
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     name: str
     rtl_files: list[Path]
@@ -19,14 +19,16 @@ class ProjectConfig:
     signal_aliases: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     backend: str = "deterministic"
     model: str = "formalchip-template-v1"
     command: str | None = None
+    persistent: bool = False
+    timeout_s: int = 600
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineConfig:
     kind: str = "mock"
     command: str | None = None
@@ -35,13 +37,13 @@ class EngineConfig:
     pass_after: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopConfig:
     max_iterations: int = 3
     workdir: Path = Path(".formalchip/runs")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintItem:
     name: str
     expr: str
@@ -50,32 +52,32 @@ class ConstraintItem:
     note: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintsConfig:
     assumptions: list[ConstraintItem] = field(default_factory=list)
     covers: list[ConstraintItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class KPIConfig:
     min_time_reduction_percent: float = 30.0
     require_bug_or_coverage: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecInput:
     kind: str
     path: Path
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LibraryPattern:
     kind: str
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FormalChipConfig:
     config_path: Path
     project: ProjectConfig
@@ -88,24 +90,44 @@ class FormalChipConfig:
     libraries: list[LibraryPattern]
 
 
+# Parser modules are imported per format so TOML users never load yaml and
+# commands that never read a config (init, engine-template) skip tomllib.
+def _load_toml(path: Path) -> dict[str, Any]:
+    import tomllib
+
+    return tomllib.loads(path.read_text(encoding="utf-8"))
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_bytes())
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    try:
+        import yaml  # type: ignore
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "YAML config requested but PyYAML is not installed. Use TOML/JSON or install pyyaml."
+        ) from exc
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+        if not isinstance(data, dict):
+            raise ValueError("Configuration root must be a mapping")
+        return data
+
+
+_LOADERS: dict[str, Callable[[Path], dict[str, Any]]] = {
+    ".toml": _load_toml,
+    ".json": _load_json,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+}
+
+
 def _load_raw(path: Path) -> dict[str, Any]:
-    if path.suffix == ".toml":
-        return tomllib.loads(path.read_text(encoding="utf-8"))
-    if path.suffix == ".json":
-        return json.loads(path.read_text(encoding="utf-8"))
-    if path.suffix in {".yaml", ".yml"}:
-        try:
-            import yaml  # type: ignore
-        except Exception as exc:  # pragma: no cover
-            raise RuntimeError(
-                "YAML config requested but PyYAML is not installed. Use TOML/JSON or install pyyaml."
-            ) from exc
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if not isinstance(data, dict):
-                raise ValueError("Configuration root must be a mapping")
-            return data
-    raise ValueError(f"Unsupported config extension: {path.suffix}")
+    if path.suffix not in _LOADERS:
+        raise ValueError(f"Unsupported config extension: {path.suffix}")
+    return parse_file_cached(path, _LOADERS[path.suffix])
 
 
 def _resolve_path(base: Path, value: str | None) -> Path | None:
@@ -126,6 +148,30 @@ def _resolve_many(base: Path, values: list[str]) -> list[Path]:
     return out
 
 
+def _optional_str(value: Any) -> str | None:
+    return None if value is None else str(value).strip()
+
+
+def _parse_constraint_list(items: list[Any], list_name: str, kind: str, default_prefix: str) -> list[ConstraintItem]:
+    out: list[ConstraintItem] = []
+    for idx, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"constraints.{list_name}[{idx}] must be a table/object")
+        expr = str(item.get("expr", "")).strip()
+        if not expr:
+            raise ValueError(f"constraints.{list_name}[{idx}].expr is required")
+        out.append(
+            ConstraintItem(
+                name=str(item.get("name", f"{default_prefix}_{idx+1}")),
+                expr=expr,
+                kind=kind,
+                when=_optional_str(item.get("when")),
+                note=_optional_str(item.get("note")),
+            )
+        )
+    return out
+
+
 def load_config(path: str | Path) -> FormalChipConfig:
     cfg_path = Path(path).resolve()
     raw = _load_raw(cfg_path)
@@ -152,6 +198,8 @@ def load_config(path: str | Path) -> FormalChipConfig:
         backend=str(llm_raw.get("backend", "deterministic")),
         model=str(llm_raw.get("model", "formalchip-template-v1")),
         command=llm_raw.get("command"),
+        persistent=bool(llm_raw.get("persistent", False)),
+        timeout_s=int(llm_raw.get("timeout_s", 600)),
     )
 
     engine_raw = raw.get("engine", {})
@@ -174,40 +222,10 @@ def load_config(path: str | Path) -> FormalChipConfig:
     if not isinstance(constraints_raw, dict):
         raise ValueError("[constraints] must be a table/object")
 
-    assumptions: list[ConstraintItem] = []
-    for idx, item in enumerate(constraints_raw.get("assumptions", [])):
-        if not isinstance(item, dict):
-            raise ValueError(f"constraints.assumptions[{idx}] must be a table/object")
-        expr = str(item.get("expr", "")).strip()
-        if not expr:
-            raise ValueError(f"constraints.assumptions[{idx}].expr is required")
-        assumptions.append(
-            ConstraintItem(
-                name=str(item.get("name", f"assumption_{idx+1}")),
-                expr=expr,
-                kind="assume",
-                when=str(item.get("when")).strip() if item.get("when") is not None else None,
-                note=str(item.get("note")).strip() if item.get("note") is not None else None,
-            )
-        )
-
-    covers: list[ConstraintItem] = []
-    for idx, item in enumerate(constraints_raw.get("covers", [])):
-        if not isinstance(item, dict):
-            raise ValueError(f"constraints.covers[{idx}] must be a table/object")
-        expr = str(item.get("expr", "")).strip()
-        if not expr:
-            raise ValueError(f"constraints.covers[{idx}].expr is required")
-        covers.append(
-            ConstraintItem(
-                name=str(item.get("name", f"cover_{idx+1}")),
-                expr=expr,
-                kind="cover",
-                when=str(item.get("when")).strip() if item.get("when") is not None else None,
-                note=str(item.get("note")).strip() if item.get("note") is not None else None,
-            )
-        )
-    constraints = ConstraintsConfig(assumptions=assumptions, covers=covers)
+    constraints = ConstraintsConfig(
+        assumptions=_parse_constraint_list(constraints_raw.get("assumptions", []), "assumptions", "assume", "assumption"),
+        covers=_parse_constraint_list(constraints_raw.get("covers", []), "covers", "cover", "cover"),
+    )
 
     kpi_raw = raw.get("kpi", {})
     if not isinstance(kpi_raw, dict):
@@ -226,7 +244,10 @@ def load_config(path: str | Path) -> FormalChipConfig:
         path_value = spec.get("path")
         if path_value is None:
             raise ValueError(f"specs[{idx}].path is required")
-        options = {k: v for k, v in spec.items() if k not in {"kind", "path"}}
+        # Copy-and-pop keeps the remaining keys in config order without a Python-level scan.
+        options = dict(spec)
+        options.pop("kind", None)
+        options.pop("path", None)
         spec_path = _resolve_path(base, str(path_value))
         assert spec_path is not None
         specs.append(SpecInput(kind=kind, path=spec_path, options=options))
@@ -237,7 +258,8 @@ def load_config(path: str | Path) -> FormalChipConfig:
         if not isinstance(lib, dict):
             raise ValueError(f"libraries[{idx}] must be a table/object")
         kind = str(lib.get("kind", "unknown"))
-        options = {k: v for k, v in lib.items() if k != "kind"}
+        options = dict(lib)
+        options.pop("kind", None)
         libraries.append(LibraryPattern(kind=kind, options=options))
 
     return FormalChipConfig(
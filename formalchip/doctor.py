@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import mmap
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
 
 from .config import FormalChipConfig
 from .pipeline import build_initial_synthesis
@@ -22,7 +26,8 @@ class DoctorReport:
         return not self.errors
 
 
-def run_doctor(config: FormalChipConfig) -> DoctorReport:
+def run_doctor(config: FormalChipConfig, *, deep: bool = True) -> DoctorReport:
+    """Validate config and tooling; with deep=False, skip the synthesis preflight."""
     report = DoctorReport()
 
     if not config.project.rtl_files:
@@ -36,21 +41,10 @@ def run_doctor(config: FormalChipConfig) -> DoctorReport:
     if missing_specs:
         report.errors.append(f"Missing spec files: {', '.join(missing_specs)}")
 
-    top_ok = False
-    if not missing_rtl:
-        mod_pat = re.compile(rf"\bmodule\s+{re.escape(config.project.top_module)}\b")
-        for rtl in config.project.rtl_files:
-            try:
-                txt = rtl.read_text(encoding="utf-8", errors="replace")
-            except OSError:
-                continue
-            if mod_pat.search(txt):
-                top_ok = True
-                break
-        if not top_ok:
-            report.warnings.append(
-                f"Top module `{config.project.top_module}` was not found by simple scan in provided RTL files."
-            )
+    if not missing_rtl and not _any_declares_module(config.project.rtl_files, config.project.top_module):
+        report.warnings.append(
+            f"Top module `{config.project.top_module}` was not found by simple scan in provided RTL files."
+        )
 
     report.infos.append(f"engine={config.engine.kind}")
     report.infos.append(f"llm_backend={config.llm.backend}")
@@ -80,7 +74,7 @@ def run_doctor(config: FormalChipConfig) -> DoctorReport:
     if unknown_libs:
         report.warnings.append(f"Unknown library kinds (ignored by synthesis): {', '.join(unknown_libs)}")
 
-    if report.errors:
+    if report.errors or not deep:
         return report
 
     try:
@@ -115,6 +109,44 @@ def run_doctor(config: FormalChipConfig) -> DoctorReport:
     return report
 
 
+@lru_cache(maxsize=128)
+def _module_pattern(top: str) -> re.Pattern[bytes]:
+    return re.compile(rb"\bmodule\s+" + re.escape(top.encode("utf-8")) + rb"\b")
+
+
+def _any_declares_module(paths: list[Path], top: str) -> bool:
+    pat = _module_pattern(top)
+    if len(paths) <= 1:
+        return any(_scan_quietly(p, pat) for p in paths)
+
+    # Stop as soon as any file declares the module; pending scans are cancelled.
+    pool = ThreadPoolExecutor(max_workers=min(8, len(paths)))
+    try:
+        futures = [pool.submit(_scan_quietly, p, pat) for p in paths]
+        return any(f.result() for f in as_completed(futures))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _scan_quietly(path: Path, pat: re.Pattern[bytes]) -> bool:
+    try:
+        return _scan_for_module(path, pat)
+    except OSError:
+        return False
+
+
+def _scan_for_module(path: Path, pat: re.Pattern[bytes]) -> bool:
+    """Search `path` for `pat` over a read-only mapping: no decode, no full in-memory copy."""
+    with path.open("rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and non-mappable inputs (pipes, some network filesystems).
+            return pat.search(fh.read()) is not None
+        with mm:
+            return pat.search(mm) is not None
+
+
 def format_doctor_report(report: DoctorReport) -> str:
     lines: list[str] = []
     lines.append("Doctor report")
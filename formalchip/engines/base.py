@@ -17,6 +17,9 @@ class EngineRunInput:
 
 class FormalEngine(Protocol):
     name: str
+    # True when a verdict depends only on the property file contents (plus the
+    # run's fixed RTL/config), so an identical candidate set may reuse it.
+    replayable: bool
 
     def tool_version(self) -> str:
         ...
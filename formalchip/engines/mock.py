@@ -4,18 +4,21 @@ from pathlib import Path
 
 from formalchip.models import FormalResult
 from formalchip.parsers import parse_generic_log
+from formalchip.util import register_tool_version
 
 from .base import EngineRunInput
 
 
 class MockEngine:
     name = "mock"
+    # Verdicts are scripted by iteration number, not by the properties.
+    replayable = False
 
     def __init__(self, pass_after: int = 1) -> None:
         self.pass_after = max(1, pass_after)
 
     def tool_version(self) -> str:
-        return "mock-engine/1.0"
+        return register_tool_version(self.name, "mock-engine/1.0")
 
     def run(self, run_input: EngineRunInput) -> FormalResult:
         log_path = run_input.iteration_dir / "mock.log"
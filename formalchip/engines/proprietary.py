@@ -3,15 +3,19 @@ from __future__ import annotations
 import os
 import shlex
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from formalchip.models import FormalResult
 from formalchip.parsers import parse_generic_log
+from formalchip.util import register_tool_version, run_command_to_file
 
 from .base import EngineRunInput
 
 
 class ScriptedEngine:
+    replayable = True
+
     def __init__(self, name: str, command: str, timeout_s: int = 1800) -> None:
         self.name = name
         self.command = command
@@ -21,19 +25,7 @@ class ScriptedEngine:
         argv = shlex.split(self.command)
         if not argv:
             return f"{self.name}:invalid-command"
-        base = argv[0]
-        try:
-            proc = subprocess.run(
-                [base, "--version"],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=20,
-            )
-            v = (proc.stdout or proc.stderr).strip().splitlines()
-            return v[0] if v else f"{base}:ok"
-        except Exception:
-            return f"{base}:version-unavailable"
+        return register_tool_version(self.name, _probe_version(argv[0]))
 
     def run(self, run_input: EngineRunInput) -> FormalResult:
         log_path = run_input.iteration_dir / f"{self.name}.log"
@@ -43,24 +35,34 @@ class ScriptedEngine:
         env["FORMALCHIP_RTL_FILES"] = os.pathsep.join(str(p) for p in run_input.context.rtl_files)
 
         argv = shlex.split(self.command)
-        proc = subprocess.run(
+        # Engine transcripts can be huge: stream them to the log instead of buffering in memory.
+        returncode = run_command_to_file(
             argv,
-            capture_output=True,
-            text=True,
-            timeout=self.timeout_s,
-            check=False,
+            log_path,
             cwd=run_input.iteration_dir,
+            timeout_s=self.timeout_s,
             env=env,
         )
-        log_path.write_text(
-            (proc.stdout or "") + ("\n" if proc.stdout else "") + (proc.stderr or ""),
-            encoding="utf-8",
-        )
         result = parse_generic_log(log_path)
-        result.metadata.update({"engine": self.name, "returncode": proc.returncode})
-        if proc.returncode != 0 and result.status == "unknown":
+        result.metadata.update({"engine": self.name, "returncode": returncode})
+        if returncode != 0 and result.status == "unknown":
             result.status = "error"
-            result.summary = f"status=error, returncode={proc.returncode}"
+            result.summary = f"status=error, returncode={returncode}"
         return result
 
 
+@lru_cache(maxsize=16)
+def _probe_version(base: str) -> str:
+    # One `--version` spawn per executable per process, shared by every engine instance.
+    try:
+        proc = subprocess.run(
+            [base, "--version"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=20,
+        )
+        v = (proc.stdout or proc.stderr).strip().splitlines()
+        return v[0] if v else f"{base}:ok"
+    except Exception:
+        return f"{base}:version-unavailable"
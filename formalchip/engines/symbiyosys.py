@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import shutil
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from formalchip.models import FormalResult
 from formalchip.parsers import parse_symbiyosys_log
-from formalchip.util import run_command, which_or_none
+from formalchip.util import link_or_copy, register_tool_version, run_command, run_command_to_file, walk_files, which_or_none
 
 from .base import EngineRunInput
 
 
 class SymbiYosysEngine:
     name = "symbiyosys"
+    replayable = True
 
     def __init__(self, command: str | None = None, sby_file: Path | None = None, timeout_s: int = 600) -> None:
         self.command = command or "sby"
@@ -19,14 +22,7 @@ class SymbiYosysEngine:
         self.timeout_s = timeout_s
 
     def tool_version(self) -> str:
-        exe = which_or_none(self.command)
-        if not exe:
-            return f"{self.command}:not-found"
-        rc, out, err = run_command([self.command, "--version"], timeout_s=30)
-        if rc == 0:
-            v = (out or err).strip().splitlines()
-            return v[0] if v else f"{self.command}:ok"
-        return f"{self.command}:version-error"
+        return register_tool_version(self.name, _probe_version(self.command))
 
     def run(self, run_input: EngineRunInput) -> FormalResult:
         iter_dir = run_input.iteration_dir
@@ -49,12 +45,12 @@ class SymbiYosysEngine:
             )
         sby_path.write_text(rendered, encoding="utf-8")
 
-        rc, out, err = run_command(
+        rc = run_command_to_file(
             [self.command, "-f", str(sby_path)],
+            log_path,
             cwd=iter_dir,
             timeout_s=self.timeout_s,
         )
-        log_path.write_text(out + ("\n" if out else "") + err, encoding="utf-8")
 
         result = parse_symbiyosys_log(log_path)
         artifact_files = _collect_sby_artifacts(iter_dir)
@@ -67,12 +63,30 @@ class SymbiYosysEngine:
         return result
 
 
+@lru_cache(maxsize=16)
+def _probe_version(command: str) -> str:
+    # One `--version` spawn per command per process, shared by every engine instance.
+    exe = which_or_none(command)
+    if not exe:
+        return f"{command}:not-found"
+    rc, out, err = run_command([command, "--version"], timeout_s=30)
+    if rc == 0:
+        v = (out or err).strip().splitlines()
+        return v[0] if v else f"{command}:ok"
+    return f"{command}:version-error"
+
+
+_SBY_PLACEHOLDER_RE = re.compile(r"\{\{(TOP_MODULE|PROPERTY_FILE|RTL_FILES)\}\}")
+
+
 def _render_sby(template: str, top: str, property_file: Path, rtl_files: list[Path]) -> str:
-    rendered = template
-    rendered = rendered.replace("{{TOP_MODULE}}", top)
-    rendered = rendered.replace("{{PROPERTY_FILE}}", str(property_file))
-    rendered = rendered.replace("{{RTL_FILES}}", "\n".join(str(p) for p in rtl_files))
-    return rendered
+    subs = {
+        "TOP_MODULE": top,
+        "PROPERTY_FILE": str(property_file),
+        "RTL_FILES": "\n".join(str(p) for p in rtl_files),
+    }
+    # One pass over the template; substituted values are never rescanned for placeholders.
+    return _SBY_PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], template)
 
 
 def _default_sby(top: str, property_file: Path, rtl_files: list[Path]) -> str:
@@ -95,20 +109,25 @@ prep -top {top}
 """
 
 
+_ARTIFACTS_DIRS = frozenset({"artifacts"})
+_NON_ARTIFACT_NAMES = frozenset({"engine.log", "run.sby", "properties.sv"})
+_ARTIFACT_EXTS = frozenset({".vcd", ".yw", ".aiw", ".cex", ".json", ".smtc", ".txt"})
+
+
 def _collect_sby_artifacts(iter_dir: Path) -> list[str]:
     """
     Collect witness-like artifacts into a stable path under artifacts/witnesses.
     Returns paths relative to iteration directory.
     """
-    keep_ext = {".vcd", ".yw", ".aiw", ".cex", ".json", ".smtc", ".txt"}
-    src_files: list[Path] = []
-    for path in iter_dir.rglob("*"):
-        if path.is_dir():
-            continue
-        if path.name in {"engine.log", "run.sby", "properties.sv"}:
+    src_files: list[tuple[str, Path]] = []
+    # The destination tree is pruned, so a collected file can never be its own source.
+    for rel_name, entry in walk_files(iter_dir, skip_top_dirs=_ARTIFACTS_DIRS):
+        name = entry.name
+        if name in _NON_ARTIFACT_NAMES:
             continue
-        if path.suffix.lower() in keep_ext or "trace" in path.name.lower() or "witness" in path.name.lower():
-            src_files.append(path)
+        lower = name.lower()
+        if os.path.splitext(lower)[1] in _ARTIFACT_EXTS or "trace" in lower or "witness" in lower:
+            src_files.append((rel_name, Path(entry.path)))
 
     if not src_files:
         return []
@@ -116,12 +135,11 @@ def _collect_sby_artifacts(iter_dir: Path) -> list[str]:
     dst_root = iter_dir / "artifacts" / "witnesses"
     dst_root.mkdir(parents=True, exist_ok=True)
     out: list[str] = []
-    for src in sorted(src_files):
-        rel = src.relative_to(iter_dir)
+    for rel_name, src in src_files:
+        rel = Path(rel_name)
         # Preserve subpaths while avoiding collisions.
         dst = dst_root / rel
         dst.parent.mkdir(parents=True, exist_ok=True)
-        if src.resolve() != dst.resolve():
-            shutil.copy2(src, dst)
+        link_or_copy(src, dst)
         out.append(str(dst.relative_to(iter_dir)))
     return out
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import subprocess
 import tarfile
+import tempfile
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
-from .util import gather_runtime_facts, sha256_file, utc_now_iso, write_json
+from .util import (
+    gather_runtime_facts,
+    known_tool_versions,
+    read_json,
+    sha256_file,
+    utc_now_iso,
+    walk_files,
+    which_or_none,
+    write_json,
+)
+
+# gzip's own default level: far faster than tarfile's 9 for near-identical size on text logs.
+_GZIP_LEVEL = 6
+# Member data is copied (and hashed) in 1 MiB blocks whatever the member size.
+_COPY_BUFSIZE = 1024 * 1024
 
 
 def build_evidence_pack(
@@ -15,49 +33,114 @@ def build_evidence_pack(
     output_path: Path | None = None,
 ) -> Path:
     run_dir = run_dir.resolve()
+    # Fall back to versions already probed in this process rather than spawning tools again.
+    tool_versions = tool_versions or known_tool_versions()
     evidence_dir = run_dir / "evidence"
     evidence_dir.mkdir(parents=True, exist_ok=True)
-
-    manifest = _build_manifest(run_dir=run_dir, config_path=config_path, tool_versions=tool_versions)
     manifest_path = evidence_dir / "manifest.json"
-    write_json(manifest_path, manifest)
 
     run_id = run_dir.name
     out = output_path or (evidence_dir / f"formalchip-evidence-{run_id}.tar.gz")
     out = out.resolve()
 
-    with tarfile.open(out, "w:gz") as tar:
-        for path in sorted(run_dir.rglob("*")):
-            if path == out:
-                continue
-            if path.is_dir():
-                continue
-            arcname = str(path.relative_to(run_dir))
-            tar.add(path, arcname=arcname)
+    # One walk: each file is read once, feeding the archive and its manifest digest
+    # together. The manifest is written and archived last, once every digest is known.
+    with _open_gzip_tar(out) as tar:
+        files = _archive_run_files(tar, run_dir=run_dir, skip={out, manifest_path})
+        manifest = _build_manifest(
+            run_dir=run_dir, config_path=config_path, tool_versions=tool_versions, files=files
+        )
+        write_json(manifest_path, manifest)
+        tar.add(manifest_path, arcname=str(manifest_path.relative_to(run_dir)))
 
     return out
 
 
-def _build_manifest(run_dir: Path, config_path: Path, tool_versions: dict[str, str]) -> dict[str, Any]:
+@contextmanager
+def _open_gzip_tar(out: Path) -> Iterator[tarfile.TarFile]:
+    """Open `out` as a streamed .tar.gz, compressing on all cores via pigz when available."""
+    pigz = which_or_none("pigz")
+    if pigz is None:
+        with tarfile.open(out, "w:gz", compresslevel=_GZIP_LEVEL, copybufsize=_COPY_BUFSIZE) as tar:
+            yield tar
+        return
+
+    # stderr goes to a file so a chatty pigz cannot block on a pipe nobody is reading.
+    with out.open("wb") as raw, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen([pigz, f"-{_GZIP_LEVEL}", "-c"], stdin=subprocess.PIPE, stdout=raw, stderr=err)
+        assert proc.stdin is not None
+        failure: BaseException | None = None
+        try:
+            with tarfile.open(
+                fileobj=proc.stdin, mode="w|", bufsize=_COPY_BUFSIZE, copybufsize=_COPY_BUFSIZE
+            ) as tar:
+                yield tar
+        except BaseException as exc:
+            failure = exc
+        # A pigz that died early has closed its end; flushing into it must not mask why.
+        with suppress(BrokenPipeError):
+            proc.stdin.close()
+        rc = proc.wait()
+        if rc != 0:
+            err.seek(0)
+            detail = err.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(f"pigz exited with status {rc} while writing {out}: {detail}") from failure
+    if failure is not None:
+        raise failure
+
+
+class _HashingReader:
+    """Read-only file wrapper that feeds every byte handed to tarfile into a digest."""
+
+    def __init__(self, fh: BinaryIO, digest: Any) -> None:
+        self._fh = fh
+        self._digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fh.read(size)
+        self._digest.update(data)
+        return data
+
+
+def _archive_run_files(tar: tarfile.TarFile, run_dir: Path, skip: set[Path]) -> list[dict[str, str | int]]:
     files: list[dict[str, str | int]] = []
-    for path in sorted(run_dir.rglob("*")):
-        if path.is_dir():
+    for arcname, entry in walk_files(run_dir):
+        path = Path(entry.path)
+        if path in skip:
             continue
-        rel = str(path.relative_to(run_dir))
-        files.append(
-            {
-                "path": rel,
-                "sha256": sha256_file(path),
-                "size": path.stat().st_size,
-            }
-        )
+        if entry.is_symlink():
+            info = tar.gettarinfo(path, arcname=arcname)
+            tar.addfile(info)
+            # Symlinks carry no data in the archive; hash the target.
+            files.append({"path": arcname, "sha256": sha256_file(path), "size": path.stat().st_size})
+            continue
+        with path.open("rb") as fh:
+            # fstat on the open handle is the only stat this file gets.
+            info = tar.gettarinfo(arcname=arcname, fileobj=fh)
+            if info.isreg():
+                digest = hashlib.sha256()
+                tar.addfile(info, _HashingReader(fh, digest))
+                sha256, size = digest.hexdigest(), info.size
+            else:
+                # A repeated inode is archived as a hard link with no data.
+                tar.addfile(info)
+                sha256, size = sha256_file(path), os.fstat(fh.fileno()).st_size
+        files.append({"path": arcname, "sha256": sha256, "size": size})
+    return files
 
+
+def _build_manifest(
+    run_dir: Path,
+    config_path: Path,
+    tool_versions: dict[str, str],
+    files: list[dict[str, str | int]],
+) -> dict[str, Any]:
     config_digest = sha256_file(config_path) if config_path.exists() else None
     gate_path = run_dir / "report" / "gate_verdict.json"
     gate_verdict = None
     if gate_path.exists():
         try:
-            gate_verdict = json.loads(gate_path.read_text(encoding="utf-8"))
+            gate_verdict = read_json(gate_path)
         except Exception:
             gate_verdict = None
     return {
@@ -76,4 +159,4 @@ def read_state(run_dir: Path) -> dict[str, Any]:
     state_path = run_dir / "state.json"
     if not state_path.exists():
         return {}
-    return json.loads(state_path.read_text(encoding="utf-8"))
+    return read_json(state_path)
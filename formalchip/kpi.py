@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import csv
-import json
 import re
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +8,12 @@ from typing import Any
 
 from .config import KPIConfig
 from .reporting import build_gate_verdict, summarize_state_dict
-from .util import utc_now_iso, write_json
+from .util import csv_column_index, parse_file_cached, read_json, utc_now_iso, write_json
+
+# Bytes patterns: property files are scanned without decoding them first.
+_PROPERTY_RE = re.compile(rb"^property\s+", re.MULTILINE)
+# A `// NOTE:` comment line (leading indentation allowed) that mentions "placeholder" in any case.
+_PLACEHOLDER_NOTE_RE = re.compile(rb"^[^\S\n]*// NOTE:.*(?i:placeholder)", re.MULTILINE)
 
 
 def compute_kpi_report(
@@ -22,7 +26,7 @@ def compute_kpi_report(
     if not state_path.exists():
         raise FileNotFoundError(f"state.json not found under {run_dir}")
 
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = read_json(state_path)
     summary = summarize_state_dict(state)
     gate = build_gate_verdict(summary, kpi=policy)
 
@@ -71,18 +75,8 @@ def evaluate_baseline_study(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(path)
 
-    reductions: list[float] = []
-    samples = 0
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            b = _parse_float(row.get("baseline_minutes_to_first_meaningful_properties"))
-            p = _parse_float(row.get("formalchip_minutes_to_first_meaningful_properties"))
-            if b is None or p is None or b <= 0:
-                continue
-            samples += 1
-            reductions.append(((b - p) / b) * 100.0)
-
+    # Gating many runs against one study parses it once.
+    samples, reductions = parse_file_cached(path, _baseline_reductions)
     avg = sum(reductions) / len(reductions) if reductions else None
     return {
         "path": str(path),
@@ -92,8 +86,30 @@ def evaluate_baseline_study(path: Path) -> dict[str, Any]:
     }
 
 
+def _baseline_reductions(path: Path) -> tuple[int, tuple[float, ...]]:
+    reductions: list[float] = []
+    samples = 0
+    with path.open("r", encoding="utf-8", newline="") as f:
+        # Plain rows indexed by column position: no per-row dict like DictReader builds.
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        b_idx = csv_column_index(header, "baseline_minutes_to_first_meaningful_properties")
+        p_idx = csv_column_index(header, "formalchip_minutes_to_first_meaningful_properties")
+        if b_idx is not None and p_idx is not None:
+            for row in reader:
+                if len(row) <= b_idx or len(row) <= p_idx:
+                    continue
+                b = _parse_float(row[b_idx])
+                p = _parse_float(row[p_idx])
+                if b is None or p is None or b <= 0:
+                    continue
+                samples += 1
+                reductions.append(((b - p) / b) * 100.0)
+    return samples, tuple(reductions)
+
+
 def _first_iteration_property_metrics(state: dict[str, Any]) -> dict[str, Any]:
-    iterations = list(state.get("iterations", []))
+    iterations = state.get("iterations") or ()
     if not iterations:
         return {
             "properties_total": 0,
@@ -110,22 +126,7 @@ def _first_iteration_property_metrics(state: dict[str, Any]) -> dict[str, Any]:
             "placeholders": 0,
         }
 
-    text = property_file.read_text(encoding="utf-8", errors="replace")
-    total = len(re.findall(r"^property\s+", text, flags=re.MULTILINE))
-    placeholders = len(
-        [
-            line
-            for line in text.splitlines()
-            if line.strip().startswith("// NOTE:") and "placeholder" in line.lower()
-        ]
-    )
-    meaningful = max(0, total - placeholders)
-
-    return {
-        "properties_total": total,
-        "properties_meaningful": meaningful,
-        "placeholders": placeholders,
-    }
+    return _file_metrics(property_file)
 
 
 def _time_to_first_meaningful_properties_min(state: dict[str, Any]) -> float | None:
@@ -160,15 +161,7 @@ def _time_to_first_meaningful_properties_min(state: dict[str, Any]) -> float | N
 
 
 def _file_metrics(path: Path) -> dict[str, int]:
-    text = path.read_text(encoding="utf-8", errors="replace")
-    total = len(re.findall(r"^property\s+", text, flags=re.MULTILINE))
-    placeholders = len(
-        [
-            line
-            for line in text.splitlines()
-            if line.strip().startswith("// NOTE:") and "placeholder" in line.lower()
-        ]
-    )
+    total, placeholders = parse_file_cached(path, _scan_property_file)
     return {
         "properties_total": total,
         "properties_meaningful": max(0, total - placeholders),
@@ -176,6 +169,13 @@ def _file_metrics(path: Path) -> dict[str, int]:
     }
 
 
+def _scan_property_file(path: Path) -> tuple[int, int]:
+    data = path.read_bytes()
+    total = len(_PROPERTY_RE.findall(data))
+    placeholders = len(_PLACEHOLDER_NOTE_RE.findall(data))
+    return total, placeholders
+
+
 def _parse_float(value: str | None) -> float | None:
     if value is None:
         return None
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import selectors
 import shlex
 import subprocess
-from dataclasses import asdict
-from typing import Protocol
+import tempfile
+import time
+from contextlib import suppress
+from dataclasses import replace
+from typing import IO, Protocol
 
 from .config import LibraryPattern, LLMConfig
 from .models import IterationFeedback, PropertyCandidate, SpecClause
 from .synthesis import SynthesisInputs, optimize_candidates, synthesize_candidates
+from .util import dumps_json, loads_json
 
 
 class LLMBackend(Protocol):
@@ -57,12 +63,16 @@ class DeterministicLLM:
         failed = set(feedback.failed_properties)
         out: list[PropertyCandidate] = []
         for prop in current:
-            clone = PropertyCandidate(**asdict(prop))
-            if clone.name in failed:
-                clone.body = _repair_body(clone.body)
-                clone.notes = (
-                    (clone.notes + " | ") if clone.notes else ""
-                ) + f"Auto-repaired after feedback: {feedback.summary}"
+            # Fields are all immutable scalars, so a shallow replace() is a full copy.
+            if prop.name in failed:
+                clone = replace(
+                    prop,
+                    body=_repair_body(prop.body),
+                    notes=((prop.notes + " | ") if prop.notes else "")
+                    + f"Auto-repaired after feedback: {feedback.summary}",
+                )
+            else:
+                clone = replace(prop)
             out.append(clone)
 
         if failed:
@@ -77,12 +87,7 @@ class DeterministicLLM:
             )
         elif feedback.status == "fail" and feedback.counterexamples:
             # If failure isn't mapped to named properties, soften all strict one-cycle implications.
-            softened: list[PropertyCandidate] = []
-            for prop in out:
-                clone = PropertyCandidate(**asdict(prop))
-                clone.body = _repair_body(clone.body)
-                softened.append(clone)
-            out = softened
+            out = [replace(prop, body=_repair_body(prop.body)) for prop in out]
 
         if feedback.coverage_hits == 0 and {"req", "ack"}.issubset(synthesis_inputs.known_signals):
             out.append(
@@ -98,12 +103,15 @@ class DeterministicLLM:
         return optimize_candidates(out)
 
 
+_BOUNDED_WINDOW_RE = re.compile(r"##\[0:(\d+)\]")
+
+
 def _repair_body(body: str) -> str:
     # Expand bounded eventuality windows when they fail quickly.
-    m = re.search(r"##\[0:(\d+)\]", body)
+    m = _BOUNDED_WINDOW_RE.search(body)
     if m:
-        old = int(m.group(1))
-        return body.replace(f"##[0:{old}]", f"##[0:{old + 2}]")
+        # Widen every copy of the first window found; other windows are left alone.
+        return body.replace(m.group(0), f"##[0:{int(m.group(1)) + 2}]")
 
     # Relax strict next-cycle implication into bounded eventuality.
     if "|=>" in body:
@@ -115,8 +123,15 @@ def _repair_body(body: str) -> str:
 class CommandLLM:
     """Pluggable command backend for external LLM integration."""
 
-    def __init__(self, command: str) -> None:
+    def __init__(self, command: str, persistent: bool = False, timeout_s: int = 600) -> None:
+        # Worker state first: __del__ runs even when the command fails to parse.
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._stderr: IO[bytes] | None = None
+        self._pending = b""
         self.command = command
+        self.persistent = persistent
+        self.timeout_s = timeout_s
+        self._argv = shlex.split(command)
 
     def propose(
         self,
@@ -124,10 +139,11 @@ class CommandLLM:
         libraries: list[LibraryPattern],
         synthesis_inputs: SynthesisInputs,
     ) -> list[PropertyCandidate]:
+        # Dataclasses go straight to the encoder, which serializes their fields.
         payload = {
             "mode": "propose",
-            "clauses": [asdict(c) for c in clauses],
-            "libraries": [asdict(l) for l in libraries],
+            "clauses": clauses,
+            "libraries": libraries,
             "synthesis_inputs": _serialize_synthesis_inputs(synthesis_inputs),
         }
         return self._call(payload)
@@ -142,28 +158,18 @@ class CommandLLM:
     ) -> list[PropertyCandidate]:
         payload = {
             "mode": "repair",
-            "current": [asdict(c) for c in current],
-            "feedback": asdict(feedback),
-            "clauses": [asdict(c) for c in clauses],
-            "libraries": [asdict(l) for l in libraries],
+            "current": current,
+            "feedback": feedback,
+            "clauses": clauses,
+            "libraries": libraries,
             "synthesis_inputs": _serialize_synthesis_inputs(synthesis_inputs),
         }
         return self._call(payload)
 
     def _call(self, payload: dict) -> list[PropertyCandidate]:
-        argv = shlex.split(self.command)
-        proc = subprocess.run(
-            argv,
-            input=json.dumps(payload),
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        if proc.returncode != 0:
-            raise RuntimeError(f"LLM command failed: {proc.stderr.strip()}")
-
+        stdout = self._exchange(payload) if self.persistent else self._run_once(payload)
         try:
-            obj = json.loads(proc.stdout)
+            obj = loads_json(stdout)
         except json.JSONDecodeError as exc:
             raise RuntimeError("LLM command did not emit valid JSON") from exc
 
@@ -173,6 +179,101 @@ class CommandLLM:
             out.append(PropertyCandidate(**raw))
         return out
 
+    def _run_once(self, payload: dict) -> bytes:
+        try:
+            proc = subprocess.run(
+                self._argv,
+                input=dumps_json(payload),
+                capture_output=True,
+                timeout=self.timeout_s,
+                check=False,
+            )
+        except subprocess.TimeoutExpired as exc:
+            raise RuntimeError(f"LLM command timed out after {self.timeout_s}s") from exc
+        if proc.returncode != 0:
+            raise RuntimeError(f"LLM command failed: {proc.stderr.decode('utf-8', 'replace').strip()}")
+        return proc.stdout
+
+    def _exchange(self, payload: dict) -> bytes:
+        # Persistent mode: one request per line in, one response per line out.
+        # Compact JSON escapes embedded newlines, so a line is always a whole payload.
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            self.close()
+            # stderr goes to a file so a chatty worker cannot block on a pipe nobody reads.
+            self._stderr = tempfile.TemporaryFile()
+            proc = self._proc = subprocess.Popen(
+                self._argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+            )
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(dumps_json(payload) + b"\n")
+            proc.stdin.flush()
+        except BrokenPipeError as exc:
+            detail = self._worker_stderr()
+            self.close()
+            raise RuntimeError(f"LLM worker exited before accepting the request: {detail}") from exc
+        return self._read_line(proc)
+
+    def _read_line(self, proc: subprocess.Popen[bytes]) -> bytes:
+        # Raw reads off the pipe fd under a deadline; bytes past the newline wait for the next call.
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + self.timeout_s
+        buf = self._pending
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while b"\n" not in buf:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    self.close(wait=False)
+                    raise RuntimeError(f"LLM worker did not respond within {self.timeout_s}s")
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    detail = self._worker_stderr()
+                    self.close()
+                    raise RuntimeError(f"LLM worker exited without a response: {detail}")
+                buf += chunk
+        line, _, self._pending = buf.partition(b"\n")
+        return line + b"\n"
+
+    def _worker_stderr(self, limit: int = 4096) -> str:
+        err = self._stderr
+        if err is None:
+            return ""
+        err.seek(0, os.SEEK_END)
+        err.seek(max(0, err.tell() - limit))
+        return err.read().decode("utf-8", "replace").strip()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the persistent worker; with ``wait=False`` it is killed rather than awaited."""
+        proc, self._proc = self._proc, None
+        err, self._stderr = self._stderr, None
+        self._pending = b""
+        if proc is not None:
+            if proc.stdin is not None:
+                with suppress(BrokenPipeError):
+                    proc.stdin.close()
+            if wait:
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+            elif proc.poll() is None:
+                proc.kill()
+            if proc.stdout is not None:
+                proc.stdout.close()
+        if err is not None:
+            err.close()
+
+    def __del__(self) -> None:
+        # Never block garbage collection or interpreter shutdown on the worker.
+        self.close(wait=False)
+
 
 def make_llm_backend(cfg: LLMConfig) -> LLMBackend:
     backend = cfg.backend.lower().strip()
@@ -181,7 +282,7 @@ def make_llm_backend(cfg: LLMConfig) -> LLMBackend:
     if backend == "command":
         if not cfg.command:
             raise ValueError("llm.command must be set when backend=command")
-        return CommandLLM(cfg.command)
+        return CommandLLM(cfg.command, persistent=cfg.persistent, timeout_s=cfg.timeout_s)
     raise ValueError(f"Unsupported llm backend: {cfg.backend}")
 
 
@@ -190,5 +291,5 @@ def _serialize_synthesis_inputs(inputs: SynthesisInputs) -> dict:
         "clock": inputs.clock,
         "reset": inputs.reset,
         "reset_active_low": inputs.reset_active_low,
-        "known_signals": sorted(inputs.known_signals),
+        "known_signals": inputs.sorted_signals,
     }
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import random
+import shutil
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -9,12 +11,12 @@ from .engines import make_engine
 from .engines.base import EngineRunInput
 from .evidence import build_evidence_pack
 from .llm import make_llm_backend
-from .models import IterationFeedback, RunContext
+from .models import FormalResult, IterationFeedback, PropertyCandidate, RunContext
 from .pipeline import build_initial_synthesis
 from .reporting import write_run_report
 from .run_state import IterationRecord, RunRecorder, RunState
 from .synthesis import optimize_candidates, write_candidate_file
-from .util import ensure_dir, utc_now_iso
+from .util import ensure_dir, link_or_copy, utc_now_iso
 
 
 def _new_run_id(project_name: str) -> str:
@@ -24,6 +26,35 @@ def _new_run_id(project_name: str) -> str:
     return f"{safe}-{stamp}-{suffix}"
 
 
+def _candidate_key(candidates: list[PropertyCandidate]) -> tuple:
+    # Every field that reaches properties.sv; equal keys mean byte-identical files.
+    return tuple((c.prop_id, c.name, c.kind, c.body, c.source_clause, c.notes) for c in candidates)
+
+
+def _replay_result(prior: FormalResult, source_dir: Path, iter_dir: Path, source_iteration: int) -> FormalResult:
+    """`prior` re-homed into `iter_dir`: its log and artifacts are linked there, so the
+    replaying iteration's record only names files inside its own directory."""
+    for rel in prior.artifact_files:
+        src = source_dir / rel
+        if src.exists():
+            dst = iter_dir / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(src, dst)
+    log_path = prior.log_path
+    if log_path.exists() and log_path.is_relative_to(source_dir):
+        log_path = iter_dir / log_path.relative_to(source_dir)
+        link_or_copy(prior.log_path, log_path)
+    return replace(
+        prior,
+        log_path=log_path,
+        failed_properties=list(prior.failed_properties),
+        counterexamples=list(prior.counterexamples),
+        unsat_cores=list(prior.unsat_cores),
+        artifact_files=list(prior.artifact_files),
+        metadata={**prior.metadata, "replayed_from_iteration": source_iteration},
+    )
+
+
 def run_formalchip(config: FormalChipConfig, max_iterations_override: int | None = None) -> RunState:
     run_id = _new_run_id(config.project.name)
     run_dir = ensure_dir(config.loop.workdir / run_id)
@@ -39,7 +70,8 @@ def run_formalchip(config: FormalChipConfig, max_iterations_override: int | None
 
     # Store a verbatim config snapshot for reproducibility.
     snapshot = run_dir / f"config.snapshot{config.config_path.suffix or '.toml'}"
-    snapshot.write_text(config.config_path.read_text(encoding="utf-8"), encoding="utf-8")
+    # copyfile uses the kernel's zero-copy path (sendfile) on Linux.
+    shutil.copyfile(config.config_path, snapshot)
 
     recorder.trace(
         "run_started",
@@ -52,109 +84,141 @@ def run_formalchip(config: FormalChipConfig, max_iterations_override: int | None
         },
     )
 
-    init = build_initial_synthesis(config)
-    clauses = init.clauses
-    libraries = init.libraries
-    synthesis_inputs = init.inputs
-    recorder.trace("clauses_loaded", {"count": len(clauses)})
-    recorder.trace("rtl_introspection", {"signal_count": len(synthesis_inputs.known_signals)})
-
+    # One backend serves the initial proposal and every repair (and, for a
+    # persistent command backend, one worker process).
     llm = make_llm_backend(config.llm)
-    engine = make_engine(config.engine)
-    tool_versions = {engine.name: engine.tool_version()}
-
-    candidates = init.candidates
-    recorder.trace("initial_candidates", {"count": len(candidates)})
-
-    final_status = "fail"
-    for iteration in range(1, max_iters + 1):
-        iter_dir = ensure_dir(run_dir / f"iter_{iteration:02d}")
-        property_file = iter_dir / "properties.sv"
-        write_candidate_file(property_file, candidates)
-        iter_started = utc_now_iso()
-        t0 = datetime.now(timezone.utc)
-
-        context = RunContext(
-            run_id=run_id,
-            run_dir=run_dir,
-            iteration=iteration,
-            rtl_files=config.project.rtl_files,
-            top_module=config.project.top_module,
-            clock=config.project.clock,
-            reset=config.project.reset,
-            reset_active_low=config.project.reset_active_low,
-        )
-
-        recorder.trace(
-            "iteration_started",
-            {
-                "iteration": iteration,
-                "properties": len(candidates),
-                "property_file": str(property_file),
-            },
-        )
-
-        result = engine.run(
-            EngineRunInput(
-                context=context,
-                candidate_file=property_file,
-                candidates=candidates,
-                iteration_dir=iter_dir,
+    try:
+        init = build_initial_synthesis(config, llm=llm)
+        clauses = init.clauses
+        libraries = init.libraries
+        synthesis_inputs = init.inputs
+        recorder.trace("clauses_loaded", {"count": len(clauses)})
+        recorder.trace("rtl_introspection", {"signal_count": len(synthesis_inputs.known_signals)})
+
+        engine = make_engine(config.engine)
+        tool_versions = {engine.name: engine.tool_version()}
+
+        candidates = init.candidates
+        recorder.trace("initial_candidates", {"count": len(candidates)})
+
+        # Within a run the RTL, engine and config are fixed, so a replayable engine's
+        # verdict for an identical candidate set is reused instead of re-running it.
+        verdicts: dict[tuple, tuple[int, Path, FormalResult]] = {}
+        prev_key: tuple | None = None
+        property_file: Path | None = None
+
+        final_status = "fail"
+        for iteration in range(1, max_iters + 1):
+            iter_dir = ensure_dir(run_dir / f"iter_{iteration:02d}")
+            key = _candidate_key(candidates)
+            iter_property_file = iter_dir / "properties.sv"
+            if property_file is None or key != prev_key:
+                write_candidate_file(iter_property_file, candidates)
+            else:
+                # Unchanged candidates: link the previous file rather than re-serializing,
+                # so every iteration directory still holds its own properties.sv.
+                link_or_copy(property_file, iter_property_file)
+            property_file = iter_property_file
+            prev_key = key
+            iter_started = utc_now_iso()
+            t0 = datetime.now(timezone.utc)
+
+            context = RunContext(
+                run_id=run_id,
+                run_dir=run_dir,
+                iteration=iteration,
+                rtl_files=config.project.rtl_files,
+                top_module=config.project.top_module,
+                clock=config.project.clock,
+                reset=config.project.reset,
+                reset_active_low=config.project.reset_active_low,
             )
-        )
 
-        state.iterations.append(
-            IterationRecord(
-                iteration=iteration,
-                property_file=str(property_file),
-                engine_log=str(result.log_path),
-                started_at=iter_started,
-                completed_at=utc_now_iso(),
-                duration_s=max(0.0, (datetime.now(timezone.utc) - t0).total_seconds()),
+            recorder.trace(
+                "iteration_started",
+                {
+                    "iteration": iteration,
+                    "properties": len(candidates),
+                    "property_file": str(property_file),
+                },
+            )
+
+            cached = verdicts.get(key) if engine.replayable else None
+            source_iteration: int | None = None
+            if cached is not None:
+                source_iteration, source_dir, prior = cached
+                result = _replay_result(prior, source_dir, iter_dir, source_iteration)
+                recorder.trace("engine_result_reused", {"iteration": iteration, "source_iteration": source_iteration})
+            else:
+                result = engine.run(
+                    EngineRunInput(
+                        context=context,
+                        candidate_file=property_file,
+                        candidates=candidates,
+                        iteration_dir=iter_dir,
+                    )
+                )
+                verdicts[key] = (iteration, iter_dir, result)
+
+            state.iterations.append(
+                IterationRecord(
+                    iteration=iteration,
+                    property_file=str(property_file),
+                    engine_log=str(result.log_path),
+                    started_at=iter_started,
+                    completed_at=utc_now_iso(),
+                    duration_s=max(0.0, (datetime.now(timezone.utc) - t0).total_seconds()),
+                    status=result.status,
+                    summary=result.summary,
+                    failed_properties=result.failed_properties,
+                    counterexamples=result.counterexamples,
+                    unsat_cores=result.unsat_cores,
+                    coverage_hits=result.coverage_hits,
+                    artifact_files=result.artifact_files,
+                    source_iteration=source_iteration,
+                )
+            )
+            recorder.trace(
+                "iteration_finished",
+                {
+                    "iteration": iteration,
+                    "status": result.status,
+                    "summary": result.summary,
+                    "failed_properties": result.failed_properties,
+                },
+            )
+            recorder.save_state()
+
+            if result.status == "pass":
+                final_status = "pass"
+                break
+            if result.status == "error":
+                final_status = "error"
+                break
+
+            feedback = IterationFeedback(
                 status=result.status,
                 summary=result.summary,
                 failed_properties=result.failed_properties,
                 counterexamples=result.counterexamples,
                 unsat_cores=result.unsat_cores,
                 coverage_hits=result.coverage_hits,
-                artifact_files=result.artifact_files,
             )
-        )
-        recorder.trace(
-            "iteration_finished",
-            {
-                "iteration": iteration,
-                "status": result.status,
-                "summary": result.summary,
-                "failed_properties": result.failed_properties,
-            },
-        )
-        recorder.save_state()
-
-        if result.status == "pass":
-            final_status = "pass"
-            break
-        if result.status == "error":
-            final_status = "error"
-            break
-
-        feedback = IterationFeedback(
-            status=result.status,
-            summary=result.summary,
-            failed_properties=result.failed_properties,
-            counterexamples=result.counterexamples,
-            unsat_cores=result.unsat_cores,
-            coverage_hits=result.coverage_hits,
-        )
-        candidates = llm.repair(
-            current=candidates,
-            feedback=feedback,
-            clauses=clauses,
-            libraries=libraries,
-            synthesis_inputs=synthesis_inputs,
-        )
-        candidates = optimize_candidates(candidates)
-        recorder.trace("candidates_repaired", {"iteration": iteration, "count": len(candidates)})
+            candidates = llm.repair(
+                current=candidates,
+                feedback=feedback,
+                clauses=clauses,
+                libraries=libraries,
+                synthesis_inputs=synthesis_inputs,
+            )
+            candidates = optimize_candidates(candidates)
+            recorder.trace("candidates_repaired", {"iteration": iteration, "count": len(candidates)})
+    finally:
+        # Also on error: a persistent command backend would otherwise keep its worker
+        # process until garbage collection.
+        close_llm = getattr(llm, "close", None)
+        if close_llm is not None:
+            close_llm()
 
     state.status = final_status
     state.completed_at = utc_now_iso()
@@ -165,6 +229,8 @@ def run_formalchip(config: FormalChipConfig, max_iterations_override: int | None
     report_json, report_md, gate_json = write_run_report(run_dir, state, kpi=config.kpi)
     state.reports = {"json": str(report_json), "markdown": str(report_md), "gate": str(gate_json)}
 
+    # The evidence pack archives trace.jsonl, so it must be on disk first.
+    recorder.flush()
     evidence_path = build_evidence_pack(
         run_dir=run_dir,
         config_path=config.config_path,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -7,18 +8,18 @@ from typing import Any, Literal
 Status = Literal["pass", "fail", "unknown", "error"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecClause:
     """A normalized verification intent extracted from any spec artifact."""
 
     clause_id: str
     text: str
     source: str
-    tags: list[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyCandidate:
     """Generated property unit that can be serialized into an SVA file."""
 
@@ -30,7 +31,7 @@ class PropertyCandidate:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IterationFeedback:
     """Normalized feedback from formal tools."""
 
@@ -42,7 +43,7 @@ class IterationFeedback:
     coverage_hits: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FormalResult:
     """Result returned by an engine adapter."""
 
@@ -57,7 +58,7 @@ class FormalResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunContext:
     """Derived context for each loop iteration."""
 
@@ -16,104 +16,178 @@ FAIL_NAME_PATTERNS = [
 
 
 def parse_symbiyosys_log(log_path: Path) -> FormalResult:
-    text = log_path.read_text(encoding="utf-8", errors="replace")
-
-    status = _detect_status(text)
-    failed = sorted(set(_collect_failed_names(text)))
-    cex = _collect_counterexample_lines(text)
-    unsat = _collect_unsat_lines(text)
-    coverage_hits = _count_coverage_hits(text)
-
-    summary = _summarize(status, failed, cex, unsat)
-    return FormalResult(
-        status=status,  # type: ignore[arg-type]
-        summary=summary,
-        log_path=log_path,
-        failed_properties=failed,
-        counterexamples=cex,
-        unsat_cores=unsat,
-        coverage_hits=coverage_hits,
-    )
+    return _parse_log(log_path)
 
 
 def parse_generic_log(log_path: Path) -> FormalResult:
-    text = log_path.read_text(encoding="utf-8", errors="replace")
-
-    status = _detect_status(text)
-    failed = sorted(set(_collect_failed_names(text)))
-    cex = _collect_counterexample_lines(text)
-    unsat = _collect_unsat_lines(text)
-    coverage_hits = _count_coverage_hits(text)
-
+    return _parse_log(log_path)
+
+
+# Logs are read in line-aligned blocks of about this many characters, so memory
+# stays bounded however large the engine transcript grows.
+_BLOCK_CHARS = 1 << 20
+_MAX_HINT_LINES = 30
+_CEX_TOKENS = ("counterexample", "trace", "witness")
+_UNSAT_TOKENS = ("unsat", "core")
+_COVER_HIT_TOKENS = ("reached", "passed", "triggered", "hit")
+# A failed-name match has at most four whitespace-separated words, so it spans
+# at most four non-blank lines.
+_FAIL_MATCH_MAX_LINES = 4
+
+
+def _parse_log(log_path: Path) -> FormalResult:
+    scan = _LogScan()
+    with log_path.open("r", encoding="utf-8", errors="replace") as f:
+        while True:
+            block = f.read(_BLOCK_CHARS)
+            if not block:
+                break
+            if not block.endswith("\n"):
+                block += f.readline()
+            scan.feed(block)
+    scan.finish()
+
+    status = _detect_status(scan.statuses, scan.words)
+    failed = sorted(scan.failed)
     return FormalResult(
         status=status,  # type: ignore[arg-type]
-        summary=_summarize(status, failed, cex, unsat),
+        summary=_summarize(status, failed, scan.cex, scan.unsat),
         log_path=log_path,
         failed_properties=failed,
-        counterexamples=cex,
-        unsat_cores=unsat,
-        coverage_hits=coverage_hits,
+        counterexamples=scan.cex,
+        unsat_cores=scan.unsat,
+        coverage_hits=scan.coverage_hits,
     )
 
 
-def _detect_status(text: str) -> str:
-    lower = text.lower()
-
+# Ordered by priority: the first status with any token present wins.
+_STATUS_TOKENS = {
+    "error": ("status: error", " done (error", "\nerror:", "sby error"),
+    "fail": ("status: failed", " done (fail", "counterexample", "assert failed"),
+    "pass": ("status: passed", " done (pass", "all properties proven", "success"),
+    "unknown": ("status: unknown", " done (unknown"),
+}
+# Bare words checked only when no status token matched anywhere.
+_FALLBACK_WORDS = ("error", "fail", "pass")
+# Fallback word contained in each status token: a block without the word cannot
+# contain the token, so the (cheap) word checks gate the token checks.
+_TOKEN_GATES = {
+    tok: next((word for word in _FALLBACK_WORDS if word in tok), None)
+    for tokens in _STATUS_TOKENS.values()
+    for tok in tokens
+}
+
+
+class _LogScan:
+    """Accumulates parse state over consecutive line-aligned blocks of one log."""
+
+    def __init__(self) -> None:
+        self.statuses: set[str] = set()
+        self.words: set[str] = set()
+        self.failed: set[str] = set()
+        self.cex: list[str] = []
+        self.unsat: list[str] = []
+        self.coverage_hits = 0
+        self._started = False
+        self._carry = ""
+        self._resume = [0] * len(FAIL_NAME_PATTERNS)
+
+    def feed(self, block: str) -> None:
+        # One lowered copy per block shared by every case-insensitive check.
+        lower = block.lower()
+        self._feed_status(lower)
+        self._feed_failed_names(block, lower)
+        self._feed_lines(block, lower)
+        self._started = True
+
+    def _feed_status(self, lower: str) -> None:
+        present = {word for word in _FALLBACK_WORDS if word in lower}
+        self.words |= present
+        for status, tokens in _STATUS_TOKENS.items():
+            if status in self.statuses:
+                # Lower-priority statuses can no longer win.
+                break
+            if any(tok in lower for tok in tokens if _TOKEN_GATES[tok] in present or _TOKEN_GATES[tok] is None):
+                self.statuses.add(status)
+                break
+        # Blocks start right after a newline, so "\nerror:" may straddle the boundary.
+        if self._started and lower.startswith("error:"):
+            self.statuses.add("error")
+
+    def _feed_failed_names(self, block: str, lower: str) -> None:
+        text = self._carry + block
+        # A match starting in the last few non-blank lines may run into the next
+        # block, so those lines are carried over and scanned again with it.
+        cut = len(text) - len(_trailing_nonblank_lines(text, _FAIL_MATCH_MAX_LINES))
+        # Every FAIL_NAME_PATTERNS entry contains "fail", so text without it has no failed names.
+        has_fail = "fail" in lower or "fail" in self._carry.lower()
+        self._scan_failed_names(text, cut, has_fail)
+        self._carry = text[cut:]
+
+    def finish(self) -> None:
+        text, self._carry = self._carry, ""
+        self._scan_failed_names(text, len(text), "fail" in text.lower())
+
+    def _scan_failed_names(self, text: str, cut: int, has_fail: bool) -> None:
+        # Each pattern resumes where its previous match ended, exactly as one
+        # finditer over the whole log would.
+        for idx, pat in enumerate(FAIL_NAME_PATTERNS):
+            pos = self._resume[idx]
+            if has_fail:
+                for m in pat.finditer(text, pos):
+                    if m.start() >= cut:
+                        break
+                    self.failed.add(m.group(1))
+                    pos = m.end()
+            self._resume[idx] = max(0, pos - cut)
+
+    def _feed_lines(self, block: str, lower: str) -> None:
+        # Block-wide checks first: categories whose tokens never occur skip the per-line tests.
+        want_cex = len(self.cex) < _MAX_HINT_LINES and any(tok in lower for tok in _CEX_TOKENS)
+        want_unsat = len(self.unsat) < _MAX_HINT_LINES and any(tok in lower for tok in _UNSAT_TOKENS)
+        want_cover = "cover" in lower
+        if not (want_cex or want_unsat or want_cover):
+            return
+
+        # Lowercasing never adds or removes line breaks, so the two splits line up.
+        for line, lo in zip(block.splitlines(), lower.splitlines()):
+            if want_cex and any(tok in lo for tok in _CEX_TOKENS):
+                self.cex.append(line.strip())
+                want_cex = len(self.cex) < _MAX_HINT_LINES
+            if want_unsat and any(tok in lo for tok in _UNSAT_TOKENS):
+                self.unsat.append(line.strip())
+                want_unsat = len(self.unsat) < _MAX_HINT_LINES
+            if want_cover and "cover" in lo and any(tok in lo for tok in _COVER_HIT_TOKENS):
+                self.coverage_hits += 1
+            if not (want_cex or want_unsat or want_cover):
+                break
+
+
+def _trailing_nonblank_lines(block: str, count: int) -> str:
+    """Suffix of `block` starting at its `count`-th last non-blank line."""
+    end = len(block)
+    start = end
+    while count and start > 0:
+        line_start = block.rfind("\n", 0, start - 1) + 1
+        if block[line_start:start].strip():
+            count -= 1
+        start = line_start
+    return block[start:end]
+
+
+def _detect_status(statuses: set[str], words: set[str]) -> str:
     # Highest priority first.
-    if any(tok in lower for tok in ["status: error", " done (error", "\nerror:", "sby error"]):
-        return "error"
-    if any(tok in lower for tok in ["status: failed", " done (fail", "counterexample", "assert failed"]):
-        return "fail"
-    if any(tok in lower for tok in ["status: passed", " done (pass", "all properties proven", "success"]):
-        return "pass"
-    if "status: unknown" in lower or " done (unknown" in lower:
-        return "unknown"
+    for status in _STATUS_TOKENS:
+        if status in statuses:
+            return status
 
     # Conservative fallback.
-    if "error" in lower:
-        return "error"
-    if "fail" in lower:
-        return "fail"
-    if "pass" in lower:
-        return "pass"
+    for word in _FALLBACK_WORDS:
+        if word in words:
+            return word
     return "unknown"
 
 
-def _collect_failed_names(text: str) -> list[str]:
-    out: list[str] = []
-    for pat in FAIL_NAME_PATTERNS:
-        for m in pat.finditer(text):
-            out.append(m.group(1))
-    return out
-
-
-def _collect_counterexample_lines(text: str) -> list[str]:
-    out: list[str] = []
-    for line in text.splitlines():
-        lo = line.lower()
-        if "counterexample" in lo or "trace" in lo or "witness" in lo:
-            out.append(line.strip())
-    return out[:30]
-
-
-def _collect_unsat_lines(text: str) -> list[str]:
-    out: list[str] = []
-    for line in text.splitlines():
-        lo = line.lower()
-        if "unsat" in lo or "core" in lo:
-            out.append(line.strip())
-    return out[:30]
-
-
-def _count_coverage_hits(text: str) -> int:
-    count = 0
-    for line in text.splitlines():
-        lo = line.lower()
-        if "cover" in lo and any(k in lo for k in ["reached", "passed", "triggered", "hit"]):
-            count += 1
-    return count
-
-
 def _summarize(status: str, failed: list[str], cex: list[str], unsat: list[str]) -> str:
     pieces = [f"status={status}"]
     if failed:
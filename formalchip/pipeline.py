@@ -3,11 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .config import FormalChipConfig, LibraryPattern
-from .llm import make_llm_backend
+from .llm import LLMBackend, make_llm_backend
 from .models import PropertyCandidate, SpecClause
 from .rtl import collect_signals
 from .spec_ingest import load_spec_clauses
-from .synthesis import SynthesisInputs, optimize_candidates, synthesize_candidates
+from .synthesis import SynthesisInputs, iter_candidates, optimize_candidates
 
 
 @dataclass
@@ -18,7 +18,11 @@ class InitialSynthesis:
     inputs: SynthesisInputs
 
 
-def build_initial_synthesis(config: FormalChipConfig, force_deterministic: bool = False) -> InitialSynthesis:
+def build_initial_synthesis(
+    config: FormalChipConfig,
+    force_deterministic: bool = False,
+    llm: LLMBackend | None = None,
+) -> InitialSynthesis:
     clauses = load_spec_clauses(config.specs)
     libraries = _libraries_with_constraints(config)
 
@@ -35,11 +39,11 @@ def build_initial_synthesis(config: FormalChipConfig, force_deterministic: bool
     )
 
     if force_deterministic:
-        candidates = synthesize_candidates(clauses, libraries, inputs)
+        # Deduplicated as they are produced; no intermediate list of every raw candidate.
+        candidates = optimize_candidates(iter_candidates(clauses, libraries, inputs))
     else:
-        llm = make_llm_backend(config.llm)
-        candidates = llm.propose(clauses=clauses, libraries=libraries, synthesis_inputs=inputs)
-    candidates = optimize_candidates(candidates)
+        llm = llm or make_llm_backend(config.llm)
+        candidates = optimize_candidates(llm.propose(clauses=clauses, libraries=libraries, synthesis_inputs=inputs))
 
     return InitialSynthesis(clauses=clauses, libraries=libraries, candidates=candidates, inputs=inputs)
 
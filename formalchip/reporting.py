@@ -1,31 +1,39 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 from .config import KPIConfig
-from .run_state import RunState
-from .util import utc_now_iso, write_json
+from .run_state import IterationRecord, RunState
+from .util import parse_file_cached, read_json, utc_now_iso, write_json
 
 
 def summarize_state_dict(state: dict[str, Any]) -> dict[str, Any]:
-    iterations = list(state.get("iterations", []))
-    failed_names: set[str] = set()
-    counterexample_count = 0
-    unsat_count = 0
-    coverage_hits = 0
-    artifact_count = 0
-    total_duration_s = 0.0
-
-    for item in iterations:
-        failed_names.update(item.get("failed_properties", []))
-        counterexample_count += len(item.get("counterexamples", []))
-        unsat_count += len(item.get("unsat_cores", []))
-        coverage_hits += int(item.get("coverage_hits", 0) or 0)
-        artifact_count += len(item.get("artifact_files", []))
-        total_duration_s += float(item.get("duration_s", 0.0) or 0.0)
-
+    iterations = state.get("iterations") or ()
+    # A builtin reduction per field instead of six accumulator updates per row.
+    return _summary(
+        state,
+        iterations=len(iterations),
+        failed_names=set().union(*(item.get("failed_properties", ()) for item in iterations)),
+        counterexample_count=sum(len(item.get("counterexamples", ())) for item in iterations),
+        unsat_count=sum(len(item.get("unsat_cores", ())) for item in iterations),
+        coverage_hits=sum(int(item.get("coverage_hits") or 0) for item in iterations),
+        artifact_count=sum(len(item.get("artifact_files", ())) for item in iterations),
+        total_duration_s=sum((float(item.get("duration_s") or 0.0) for item in iterations), 0.0),
+    )
+
+
+def _summary(
+    state: dict[str, Any],
+    *,
+    iterations: int,
+    failed_names: set[str],
+    counterexample_count: int,
+    unsat_count: int,
+    coverage_hits: int,
+    artifact_count: int,
+    total_duration_s: float,
+) -> dict[str, Any]:
     bug_found = len(failed_names) > 0 or counterexample_count > 0
 
     return {
@@ -34,7 +42,7 @@ def summarize_state_dict(state: dict[str, Any]) -> dict[str, Any]:
         "status": state.get("status"),
         "started_at": state.get("started_at"),
         "completed_at": state.get("completed_at"),
-        "iterations": len(iterations),
+        "iterations": iterations,
         "total_duration_s": round(total_duration_s, 3),
         "failed_property_count": len(failed_names),
         "counterexample_lines": counterexample_count,
@@ -46,33 +54,26 @@ def summarize_state_dict(state: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _state_to_dict(state: RunState) -> dict[str, Any]:
-    return {
+def summarize_state(state: RunState) -> dict[str, Any]:
+    """`summarize_state_dict` over a live `RunState`, read by attribute with no dict copy."""
+    iterations = state.iterations
+    header = {
         "run_id": state.run_id,
+        "status": state.status,
         "started_at": state.started_at,
         "completed_at": state.completed_at,
-        "status": state.status,
-        "config_path": state.config_path,
         "evidence_pack": state.evidence_pack,
-        "iterations": [
-            {
-                "iteration": it.iteration,
-                "property_file": it.property_file,
-                "engine_log": it.engine_log,
-                "started_at": it.started_at,
-                "completed_at": it.completed_at,
-                "duration_s": it.duration_s,
-                "status": it.status,
-                "summary": it.summary,
-                "failed_properties": it.failed_properties,
-                "counterexamples": it.counterexamples,
-                "unsat_cores": it.unsat_cores,
-                "coverage_hits": it.coverage_hits,
-                "artifact_files": it.artifact_files,
-            }
-            for it in state.iterations
-        ],
     }
+    return _summary(
+        header,
+        iterations=len(iterations),
+        failed_names=set().union(*(it.failed_properties for it in iterations)),
+        counterexample_count=sum(len(it.counterexamples) for it in iterations),
+        unsat_count=sum(len(it.unsat_cores) for it in iterations),
+        coverage_hits=sum(int(it.coverage_hits or 0) for it in iterations),
+        artifact_count=sum(len(it.artifact_files) for it in iterations),
+        total_duration_s=sum((float(it.duration_s or 0.0) for it in iterations), 0.0),
+    )
 
 
 def build_gate_verdict(summary: dict[str, Any], kpi: KPIConfig | None = None) -> dict[str, Any]:
@@ -107,8 +108,7 @@ def write_run_report(run_dir: Path, state: RunState, kpi: KPIConfig | None = Non
     report_dir = run_dir / "report"
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    state_dict = _state_to_dict(state)
-    summary = summarize_state_dict(state_dict)
+    summary = summarize_state(state)
     gate = build_gate_verdict(summary, kpi=kpi)
 
     json_path = report_dir / "summary.json"
@@ -117,7 +117,7 @@ def write_run_report(run_dir: Path, state: RunState, kpi: KPIConfig | None = Non
 
     write_json(json_path, summary)
     write_json(gate_path, gate)
-    md_path.write_text(_render_markdown(summary, state_dict, gate), encoding="utf-8")
+    md_path.write_text(_render_markdown(summary, state.iterations, gate), encoding="utf-8")
     return json_path, md_path, gate_path
 
 
@@ -125,12 +125,13 @@ def load_report(run_dir: Path) -> dict[str, Any]:
     run_dir = run_dir.resolve()
     summary_path = run_dir / "report" / "summary.json"
     if summary_path.exists():
-        return json.loads(summary_path.read_text(encoding="utf-8"))
+        # Repeated loads of an unchanged report reuse the first parse; callers get their own copy.
+        return parse_file_cached(summary_path, read_json)
 
     state_path = run_dir / "state.json"
     if not state_path.exists():
         raise FileNotFoundError(f"No report/summary.json or state.json found under {run_dir}")
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = read_json(state_path)
     summary = summarize_state_dict(state)
     write_json(summary_path, summary)
     return summary
@@ -144,46 +145,66 @@ def load_gate_verdict(run_dir: Path) -> dict[str, Any]:
         gate = build_gate_verdict(summary)
         write_json(gate_path, gate)
         return gate
-    return json.loads(gate_path.read_text(encoding="utf-8"))
-
-
-def _render_markdown(summary: dict[str, Any], state: dict[str, Any], gate: dict[str, Any]) -> str:
-    lines: list[str] = []
-    lines.append("# FormalChip Run Summary")
-    lines.append("")
-    lines.append(f"- Run ID: `{summary.get('run_id')}`")
-    lines.append(f"- Status: `{summary.get('status')}`")
-    lines.append(f"- Iterations: `{summary.get('iterations')}`")
-    lines.append(f"- Duration (s): `{summary.get('total_duration_s')}`")
-    lines.append(f"- Failed Properties (unique): `{summary.get('failed_property_count')}`")
-    lines.append(f"- Counterexample Lines: `{summary.get('counterexample_lines')}`")
-    lines.append(f"- Coverage Hits: `{summary.get('coverage_hits')}`")
-    lines.append(f"- Artifact Files: `{summary.get('artifact_files')}`")
-    lines.append("")
-
-    lines.append("## Gate Verdict")
-    lines.append("")
-    lines.append(f"- Passed: `{gate.get('passed')}`")
-    for key, value in gate.get("checks", {}).items():
-        lines.append(f"- `{key}`: `{value}`")
-    lines.append("")
-
-    lines.append("## Iterations")
-    lines.append("")
-    lines.append("| Iter | Status | Duration (s) | Coverage Hits | Summary |")
-    lines.append("| --- | --- | --- | --- | --- |")
-    for item in state.get("iterations", []):
-        iter_id = item.get("iteration")
-        status = item.get("status")
-        duration = item.get("duration_s", 0.0)
-        cov = item.get("coverage_hits", 0)
-        summary_text = str(item.get("summary", "")).replace("|", "\\|")
-        lines.append(f"| {iter_id} | {status} | {duration} | {cov} | {summary_text} |")
-    lines.append("")
+    return parse_file_cached(gate_path, read_json)
+
+
+_MARKDOWN_HEAD = (
+    "# FormalChip Run Summary\n"
+    "\n"
+    "- Run ID: `{run_id}`\n"
+    "- Status: `{status}`\n"
+    "- Iterations: `{iterations}`\n"
+    "- Duration (s): `{total_duration_s}`\n"
+    "- Failed Properties (unique): `{failed_property_count}`\n"
+    "- Counterexample Lines: `{counterexample_lines}`\n"
+    "- Coverage Hits: `{coverage_hits}`\n"
+    "- Artifact Files: `{artifact_files}`\n"
+    "\n"
+    "## Gate Verdict\n"
+    "\n"
+    "- Passed: `{passed}`\n"
+)
+_MARKDOWN_TABLE_HEAD = (
+    "\n"
+    "## Iterations\n"
+    "\n"
+    "| Iter | Status | Duration (s) | Coverage Hits | Summary |\n"
+    "| --- | --- | --- | --- | --- |\n"
+)
+_MARKDOWN_SUMMARY_KEYS = (
+    "run_id",
+    "status",
+    "iterations",
+    "total_duration_s",
+    "failed_property_count",
+    "counterexample_lines",
+    "coverage_hits",
+    "artifact_files",
+)
+
+
+def _render_markdown(summary: dict[str, Any], iterations: list[IterationRecord], gate: dict[str, Any]) -> str:
+    head = _MARKDOWN_HEAD.format_map(
+        {key: summary.get(key) for key in _MARKDOWN_SUMMARY_KEYS} | {"passed": gate.get("passed")}
+    )
+    checks = "".join(f"- `{key}`: `{value}`\n" for key, value in gate.get("checks", {}).items())
+    rows = "".join(
+        f"| {it.iteration} | {it.status} | {it.duration_s} | {it.coverage_hits} | {_escape_cell(_row_summary(it))} |\n"
+        for it in iterations
+    )
+    out = head + checks + _MARKDOWN_TABLE_HEAD + rows + "\n"
 
     evidence_pack = summary.get("evidence_pack")
     if evidence_pack:
-        lines.append(f"Evidence pack: `{evidence_pack}`")
+        out += f"Evidence pack: `{evidence_pack}`\n"
+    return out
+
+
+def _row_summary(it: IterationRecord) -> str:
+    if it.source_iteration is None:
+        return it.summary
+    return f"{it.summary} (replayed from iteration {it.source_iteration})"
 
-    return "\n".join(lines) + "\n"
 
+def _escape_cell(value: Any) -> str:
+    return str(value).replace("|", "\\|")
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .util import parse_file_cached
+
 
 DECL_RE = re.compile(
     r"\b(?:input|output|inout|wire|logic|reg)\b(?:\s+(?:signed|unsigned))?(?:\s*\[[^\]]+\])?\s+([^;]+);",
     re.IGNORECASE,
 )
 IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
-DECL_KEYWORDS = {"input", "output", "inout", "wire", "logic", "reg", "signed", "unsigned"}
+DECL_KEYWORDS = frozenset({"input", "output", "inout", "wire", "logic", "reg", "signed", "unsigned"})
+_LINE_COMMENT_RE = re.compile(r"//.*$", re.MULTILINE)
+_DIMENSION_RE = re.compile(r"\[[^\]]+\]")
 
 
 def collect_signals(rtl_files: list[Path]) -> set[str]:
@@ -17,18 +22,32 @@ def collect_signals(rtl_files: list[Path]) -> set[str]:
     Collect a best-effort set of declared signal names from RTL files.
     This is intentionally lightweight to avoid parser dependencies.
     """
+    paths = [p for p in rtl_files if p.exists()]
+    if len(paths) <= 1:
+        return set().union(*map(_signals_in, paths))
+
+    # File reads release the GIL, so multi-file designs overlap their I/O.
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return set().union(*pool.map(_signals_in, paths))
+
+
+def _signals_in(path: Path) -> set[str]:
+    return parse_file_cached(path, _scan_signals)
+
+
+def _scan_signals(path: Path) -> set[str]:
     out: set[str] = set()
-    for path in rtl_files:
-        if not path.exists():
-            continue
-        text = path.read_text(encoding="utf-8", errors="replace")
-        # Strip one-line comments to reduce false positives.
-        text = re.sub(r"//.*$", "", text, flags=re.MULTILINE)
-        for m in DECL_RE.finditer(text):
-            names = m.group(1)
-            for part in names.split(","):
-                part = re.sub(r"\[[^\]]+\]", " ", part)
-                tokens = [tok for tok in IDENT_RE.findall(part) if tok.lower() not in DECL_KEYWORDS]
-                if tokens:
-                    out.add(tokens[-1])
+    text = path.read_text(encoding="utf-8", errors="replace")
+    # Strip one-line comments to reduce false positives.
+    text = _LINE_COMMENT_RE.sub("", text)
+    for m in DECL_RE.finditer(text):
+        names = m.group(1)
+        for part in names.split(","):
+            if "[" in part:
+                part = _DIMENSION_RE.sub(" ", part)
+            # Only the last non-keyword identifier is the declared name.
+            for tok in reversed(IDENT_RE.findall(part)):
+                if tok.lower() not in DECL_KEYWORDS:
+                    out.add(tok)
+                    break
     return out
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .util import append_jsonl, ensure_dir, utc_now_iso, write_json
+from .util import ensure_dir, utc_now_iso, write_json
+
+# Trace lines are buffered and appended in batches: at most this many are held
+# before a write, and every save_state() flushes so trace and state agree.
+_TRACE_FLUSH_EVENTS = 64
 
 
 @dataclass
@@ -22,6 +28,28 @@ class IterationRecord:
     unsat_cores: list[str] = field(default_factory=list)
     coverage_hits: int = 0
     artifact_files: list[str] = field(default_factory=list)
+    # Iteration whose engine verdict this record replays; None for a fresh engine run.
+    source_iteration: int | None = None
+
+
+def iteration_to_dict(it: IterationRecord) -> dict[str, Any]:
+    """The JSON form of an iteration record shared by state.json and run reports."""
+    return {
+        "iteration": it.iteration,
+        "property_file": it.property_file,
+        "engine_log": it.engine_log,
+        "started_at": it.started_at,
+        "completed_at": it.completed_at,
+        "duration_s": it.duration_s,
+        "status": it.status,
+        "summary": it.summary,
+        "failed_properties": it.failed_properties,
+        "counterexamples": it.counterexamples,
+        "unsat_cores": it.unsat_cores,
+        "coverage_hits": it.coverage_hits,
+        "artifact_files": it.artifact_files,
+        "source_iteration": it.source_iteration,
+    }
 
 
 @dataclass
@@ -42,9 +70,14 @@ class RunRecorder:
         self.state_path = run_dir / "state.json"
         self.trace_path = run_dir / "trace.jsonl"
         self.state = state
+        self._pending: list[str] = []
         ensure_dir(run_dir)
+        # Writes whatever is still buffered when the recorder is dropped, e.g. after
+        # an exception escapes the run loop, or at interpreter exit.
+        weakref.finalize(self, _flush_trace, self.trace_path, self._pending)
 
     def save_state(self) -> None:
+        self.flush()
         write_json(
             self.state_path,
             {
@@ -55,33 +88,24 @@ class RunRecorder:
                 "config_path": self.state.config_path,
                 "evidence_pack": self.state.evidence_pack,
                 "reports": self.state.reports,
-                "iterations": [
-                    {
-                        "iteration": it.iteration,
-                        "property_file": it.property_file,
-                        "engine_log": it.engine_log,
-                        "started_at": it.started_at,
-                        "completed_at": it.completed_at,
-                        "duration_s": it.duration_s,
-                        "status": it.status,
-                        "summary": it.summary,
-                        "failed_properties": it.failed_properties,
-                        "counterexamples": it.counterexamples,
-                        "unsat_cores": it.unsat_cores,
-                        "coverage_hits": it.coverage_hits,
-                        "artifact_files": it.artifact_files,
-                    }
-                    for it in self.state.iterations
-                ],
+                "iterations": [iteration_to_dict(it) for it in self.state.iterations],
             },
         )
 
     def trace(self, event: str, payload: dict[str, Any] | None = None) -> None:
-        append_jsonl(
-            self.trace_path,
-            {
-                "timestamp": utc_now_iso(),
-                "event": event,
-                "payload": payload or {},
-            },
-        )
+        # Serialized now, so later mutation of `payload` cannot change the record.
+        record = {"timestamp": utc_now_iso(), "event": event, "payload": payload or {}}
+        self._pending.append(json.dumps(record, sort_keys=True) + "\n")
+        if len(self._pending) >= _TRACE_FLUSH_EVENTS:
+            self.flush()
+
+    def flush(self) -> None:
+        _flush_trace(self.trace_path, self._pending)
+
+
+def _flush_trace(path: Path, pending: list[str]) -> None:
+    if not pending:
+        return
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(pending)
+    pending.clear()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterator
+from typing import TextIO
+
+from formalchip.util import csv_column_index
+
+
+def read_rows(f: TextIO, columns: tuple[tuple[str, ...], ...]) -> Iterator[list[str]]:
+    """Yield one value per entry of `columns` per data row: the first non-empty alias cell.
+
+    Column indices are resolved once from the header; blank lines are skipped
+    like `csv.DictReader` does, and a missing or short cell reads as "".
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    plan = [
+        [i for i in (csv_column_index(header, alias) for alias in aliases) if i is not None]
+        for aliases in columns
+    ]
+    width = max((i for idxs in plan for i in idxs), default=-1) + 1
+    pad = [""] * width
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += pad[len(row):]
+        out: list[str] = []
+        for idxs in plan:
+            value = ""
+            for i in idxs:
+                value = row[i]
+                if value:
+                    break
+            out.append(value)
+        yield out
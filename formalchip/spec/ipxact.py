@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 import xml.etree.ElementTree as ET
 
 from formalchip.models import SpecClause
 
+_TAGS_RESET = ("ipxact", "register", "reset")
+
 
 def _find_text(node: ET.Element, suffix: str) -> str | None:
     for child in node.iter():
@@ -21,6 +24,7 @@ def parse_ipxact(path: Path, options: dict[str, Any] | None = None) -> list[Spec
     root = tree.getroot()
 
     regs = [elem for elem in root.iter() if elem.tag.endswith("register")]
+    source = sys.intern(str(path))
     clauses: list[SpecClause] = []
     for idx, reg in enumerate(regs, 1):
         name = _find_text(reg, "name") or f"reg_{idx}"
@@ -29,8 +33,8 @@ def parse_ipxact(path: Path, options: dict[str, Any] | None = None) -> list[Spec
             SpecClause(
                 clause_id=f"ipxact_{idx:03d}_reset",
                 text=f"Register {name} resets to {reset}.",
-                source=str(path),
-                tags=["ipxact", "register", "reset"],
+                source=source,
+                tags=_TAGS_RESET,
                 metadata={"register": name, "reset": reset},
             )
         )
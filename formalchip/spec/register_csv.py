@@ -1,11 +1,29 @@
 from __future__ import annotations
 
-import csv
+import re
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from formalchip.models import SpecClause
 
+from ._csv import read_rows
+
+_COLUMNS = (
+    ("name", "register"),
+    ("address", "addr"),
+    ("reset", "reset_value"),
+    ("access", "sw_access"),
+    ("width", "bits"),
+)
+
+# Shared by every clause of a kind; consumers only test membership.
+_TAGS_RESET = ("register", "reset")
+_TAGS_RO = ("register", "access", "read_only")
+_READ_ONLY = frozenset({"ro", "read-only", "r"})
+_PLACEHOLDER_RE = re.compile(r"\{(name|name_lower|name_upper)\}")
+_NAME_TRANSFORMS: dict[str, Callable[[str], str]] = {"name": str, "name_lower": str.lower, "name_upper": str.upper}
+
 
 def _parse_int(value: str | None) -> int | None:
     if value is None:
@@ -21,37 +39,49 @@ def _parse_int(value: str | None) -> int | None:
         return None
 
 
-def _render_signal(template: str, name: str) -> str:
-    return template.format(name=name, name_lower=name.lower(), name_upper=name.upper())
+def _signal_renderer(template: str) -> Callable[[str], str]:
+    # Split once per file instead of running str.format's parser per row.
+    pieces = _PLACEHOLDER_RE.split(template)
+    literals, fields = pieces[0::2], pieces[1::2]
+    if any("{" in lit or "}" in lit for lit in literals):
+        # Format specs, conversions or escaped braces: let str.format handle them.
+        return lambda name: template.format(name=name, name_lower=name.lower(), name_upper=name.upper())
+    head = literals[0]
+    steps = [(_NAME_TRANSFORMS[fld], lit) for fld, lit in zip(fields, literals[1:])]
+
+    def render(name: str) -> str:
+        return head + "".join(fn(name) + lit for fn, lit in steps)
+
+    return render
 
 
 def parse_register_csv(path: Path, options: dict[str, Any] | None = None) -> list[SpecClause]:
     options = options or {}
-    signal_template = str(options.get("signal_template", "{name_lower}_q"))
+    render_signal = _signal_renderer(str(options.get("signal_template", "{name_lower}_q")))
     sw_we_signal = options.get("sw_we_signal")
     sw_addr_signal = options.get("sw_addr_signal")
     sw_addr_width = int(options.get("sw_addr_width", 32))
 
+    source = sys.intern(str(path))
     clauses: list[SpecClause] = []
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
         idx = 0
-        for row in reader:
+        for name, address, reset, access, width in read_rows(f, _COLUMNS):
             idx += 1
-            name = (row.get("name") or row.get("register") or "reg").strip()
-            address = (row.get("address") or row.get("addr") or "").strip()
-            reset = (row.get("reset") or row.get("reset_value") or "0").strip()
-            access = (row.get("access") or row.get("sw_access") or "rw").strip().lower()
-            width = (row.get("width") or row.get("bits") or "32").strip()
-            signal = _render_signal(signal_template, name)
+            name = (name or "reg").strip()
+            address = address.strip()
+            reset = (reset or "0").strip()
+            access = (access or "rw").strip().lower()
+            width = (width or "32").strip()
+            signal = render_signal(name)
             address_int = _parse_int(address)
 
             clauses.append(
                 SpecClause(
                     clause_id=f"reg_{idx:03d}_reset",
                     text=f"Register {name} resets to {reset}.",
-                    source=str(path),
-                    tags=["register", "reset"],
+                    source=source,
+                    tags=_TAGS_RESET,
                     metadata={
                         "register": name,
                         "address": address,
@@ -66,13 +96,13 @@ def parse_register_csv(path: Path, options: dict[str, Any] | None = None) -> lis
                     },
                 )
             )
-            if access in {"ro", "read-only", "r"}:
+            if access in _READ_ONLY:
                 clauses.append(
                     SpecClause(
                         clause_id=f"reg_{idx:03d}_ro",
                         text=f"Register {name} is read-only from software interface.",
-                        source=str(path),
-                        tags=["register", "access", "read_only"],
+                        source=source,
+                        tags=_TAGS_RO,
                         metadata={
                             "register": name,
                             "address": address,
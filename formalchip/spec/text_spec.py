@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 
 from formalchip.models import SpecClause
 
+_TAGS_TEXT = ("text",)
+
 
 def parse_text_spec(path: Path, options: dict[str, Any] | None = None) -> list[SpecClause]:
     _ = options
+    source = sys.intern(str(path))
     clauses: list[SpecClause] = []
     lines = path.read_text(encoding="utf-8").splitlines()
     counter = 0
@@ -25,8 +29,8 @@ def parse_text_spec(path: Path, options: dict[str, Any] | None = None) -> list[S
             SpecClause(
                 clause_id=cid,
                 text=line,
-                source=str(path),
-                tags=["text"],
+                source=source,
+                tags=_TAGS_TEXT,
             )
         )
     return clauses
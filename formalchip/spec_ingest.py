@@ -3,6 +3,7 @@ from __future__ import annotations
 from formalchip.config import SpecInput
 from formalchip.models import SpecClause
 from formalchip.spec import parse_ipxact, parse_register_csv, parse_rule_table_csv, parse_text_spec
+from formalchip.util import parse_file_cached
 
 
 SUPPORTED_SPEC_KINDS = {
@@ -19,5 +20,6 @@ def load_spec_clauses(specs: list[SpecInput]) -> list[SpecClause]:
         fn = SUPPORTED_SPEC_KINDS.get(spec.kind)
         if fn is None:
             raise ValueError(f"Unsupported spec kind: {spec.kind}")
-        out.extend(fn(spec.path, spec.options))
+        # `run` builds the pipeline twice (doctor preflight, then the loop); the second build reuses the parse.
+        out.extend(parse_file_cached(spec.path, fn, spec.options))
     return out
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+# Files written by `formalchip init`, as (path relative to target, content).
+STARTER_FILES: tuple[tuple[str, str], ...] = (
+    (
+        "formalchip.toml",
+        """[project]
+name = "pilot-control"
+rtl_files = ["rtl/top.sv"]
+top_module = "top"
+clock = "clk"
+reset = "rst_n"
+reset_active_low = true
+signal_aliases = { request = "req", acknowledge = "ack" }
+
+[llm]
+backend = "deterministic"
+model = "formalchip-template-v1"
+
+[engine]
+# Use `symbiyosys` for real proofs if installed. `mock` is CI-safe.
+kind = "mock"
+pass_after = 2
+# command = "sby"
+# sby_file = "formal/top.sby"
+
+[loop]
+max_iterations = 3
+workdir = ".formalchip/runs"
+
+[[specs]]
+kind = "text"
+path = "spec/control_logic.md"
+
+[[specs]]
+kind = "register_csv"
+path = "spec/registers.csv"
+signal_template = "{name_lower}_q"
+sw_we_signal = "sw_we"
+sw_addr_signal = "sw_addr"
+sw_addr_width = 32
+
+[[specs]]
+kind = "rule_table_csv"
+path = "spec/protocol_rules.csv"
+
+[[libraries]]
+kind = "handshake"
+req = "req"
+ack = "ack"
+bound = 4
+
+[[libraries]]
+kind = "fifo_safety"
+full = "fifo_full"
+empty = "fifo_empty"
+push = "fifo_push"
+pop = "fifo_pop"
+
+[[libraries]]
+kind = "reset_sequence"
+signal = "valid"
+value = "1'b0"
+latency = 1
+
+[[libraries]]
+kind = "inline"
+name = "ctrl_write_decode_valid"
+expr = "(sw_we && (sw_addr == 32'h00000004)) |-> !fifo_full"
+property_kind = "assert"
+
+[constraints]
+assumptions = [
+  { name = "env_no_push_and_pop_when_empty", expr = "!(fifo_push && fifo_pop && fifo_empty)", note = "Environment sanity assumption" }
+]
+covers = [
+  { name = "cover_req_ack", expr = "req ##[1:4] ack", note = "Observe at least one handshake sequence" }
+]
+
+[kpi]
+min_time_reduction_percent = 30.0
+require_bug_or_coverage = true
+""",
+    ),
+    (
+        "rtl/top.sv",
+        """module top(
+  input  logic        clk,
+  input  logic        rst_n,
+  input  logic        req,
+  output logic        ack,
+  input  logic        fifo_push,
+  input  logic        fifo_pop,
+  output logic        fifo_full,
+  output logic        fifo_empty,
+  output logic        valid,
+  input  logic        sw_we,
+  input  logic [31:0] sw_addr,
+  input  logic [31:0] sw_wdata
+);
+
+  logic [31:0] status_q;
+  logic [31:0] ctrl_q;
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      status_q <= 32'h0;
+      ctrl_q <= 32'h0;
+      ack <= 1'b0;
+      valid <= 1'b0;
+    end else begin
+      ack <= req;
+      valid <= !fifo_empty;
+
+      // CTRL register write at 0x04
+      if (sw_we && (sw_addr == 32'h00000004)) begin
+        ctrl_q <= sw_wdata;
+      end
+    end
+  end
+
+  assign fifo_full = 1'b0;
+  assign fifo_empty = 1'b1;
+endmodule
+""",
+    ),
+    (
+        "spec/control_logic.md",
+        """# Control Logic Intent
+
+- If req then ack next cycle.
+- Never fifo_push and fifo_full.
+- valid should be low right after reset.
+""",
+    ),
+    (
+        "spec/registers.csv",
+        """name,address,width,reset,access
+STATUS,0x00,32,0x0,ro
+CTRL,0x04,32,0x0,rw
+""",
+    ),
+    (
+        "spec/protocol_rules.csv",
+        """rule_id,condition,guarantee
+R1,req,ack
+R2,fifo_full,!fifo_push
+R3,fifo_empty,!fifo_pop
+""",
+    ),
+)
+
+
+def scaffold_starter_project(target: Path) -> None:
+    target.mkdir(parents=True, exist_ok=True)
+    (target / "rtl").mkdir(parents=True, exist_ok=True)
+    (target / "spec").mkdir(parents=True, exist_ok=True)
+
+    for rel, content in STARTER_FILES:
+        _write_if_missing(target / rel, content)
+
+
+def _write_if_missing(path: Path, content: str) -> None:
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -11,7 +13,15 @@ from .models import PropertyCandidate, SpecClause
 
 _IDENTIFIER_RE = re.compile(r"[^a-zA-Z0-9_]+")
 _TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
-_SV_KEYWORDS = {
+# Digits a lowered sized-literal tail (d0, hff, b1010 from 8'd0 / 8'hff) may carry after its base letter.
+_BASE_TAIL_CHARS = frozenset("0123456789abcdefxz_")
+# Text-clause shapes, tried in this order against the lowered clause. Each search
+# is gated on literal words its pattern requires, so most clauses skip the regex.
+_IF_THEN_RE = re.compile(r"if\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+then\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+next\s+cycle")
+_NEVER_RE = re.compile(r"never\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+and\s+([a-zA-Z_][a-zA-Z0-9_]*)")
+_WITHIN_RE = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*)\s+.*within\s+(\d+)\s+cycles\s+.*([a-zA-Z_][a-zA-Z0-9_]*)")
+_RESET_LEVEL_RE = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*)\s+should\s+be\s+(low|high)\s+right\s+after\s+reset")
+_SV_KEYWORDS = frozenset({
     "if",
     "else",
     "begin",
@@ -29,8 +39,8 @@ _SV_KEYWORDS = {
     "not",
     "true",
     "false",
-}
-_SV_SYSTEM_FUNCTIONS = {
+})
+_SV_SYSTEM_FUNCTIONS = frozenset({
     "past",
     "rose",
     "fell",
@@ -45,6 +55,16 @@ _SV_SYSTEM_FUNCTIONS = {
     "bits",
     "signed",
     "unsigned",
+})
+# Lowered tokens that are never signal names; one lookup per token.
+_NON_SIGNAL_WORDS = _SV_KEYWORDS | _SV_SYSTEM_FUNCTIONS
+
+# Maps a normalized kind to the module's literal, so dynamically built spellings are
+# not carried into candidates (and their dedup signatures) as separate str objects.
+_PROPERTY_KINDS: dict[str, Literal["assert", "assume", "cover"]] = {
+    "assert": "assert",
+    "assume": "assume",
+    "cover": "cover",
 }
 
 SUPPORTED_LIBRARY_KINDS = {
@@ -61,14 +81,45 @@ class SynthesisInputs:
     clock: str
     reset: str
     reset_active_low: bool
-    known_signals: set[str] = field(default_factory=set)
+    known_signals: frozenset[str] = field(default_factory=frozenset)
     signal_aliases: dict[str, str] = field(default_factory=dict)
+    sorted_signals: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # SVA fragments shared by every generated property, rendered once per inputs.
+    clock_event: str = field(init=False, repr=False, compare=False)
+    disable: str = field(init=False, repr=False, compare=False)
+    reset_asserted: str = field(init=False, repr=False, compare=False)
+    placeholder_body: str = field(init=False, repr=False, compare=False)
+    alias_probe: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    # Memo for _resolve_signal_name: token -> resolved name.
+    resolved_names: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen so the sorted view computed once here can never go stale.
+        self.known_signals = frozenset(self.known_signals)
+        self.sorted_signals = tuple(sorted(self.known_signals))
+        self.clock_event = clocking(self.clock)
+        self.disable = _reset_disable(self.reset, self.reset_active_low)
+        self.reset_asserted = _reset_asserted(self.reset, self.reset_active_low)
+        self.placeholder_body = _placeholder_body(self.clock, self.reset, self.reset_active_low)
+        self.alias_probe = _alias_probe(self.signal_aliases)
+        self.resolved_names = {}
+
+
+def _alias_probe(aliases: dict[str, str]) -> re.Pattern[str] | None:
+    # A token resolves through its exact, lower or upper spelling, so every alias hit
+    # shows up as a lowered key somewhere in the lowered expression.
+    if not aliases:
+        return None
+    keys = sorted({k.lower() for k in aliases}, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, keys)))
 
 
 def supported_library_kinds() -> set[str]:
     return set(SUPPORTED_LIBRARY_KINDS)
 
 
+# Pure in its argument; `run` synthesizes the same names twice (doctor, then the loop).
+@lru_cache(maxsize=4096)
 def _sanitize_id(value: str) -> str:
     out = _IDENTIFIER_RE.sub("_", value).strip("_")
     if not out:
@@ -86,6 +137,9 @@ def _reset_asserted(reset: str, active_low: bool) -> str:
     return f"!{reset}" if active_low else reset
 
 
+# Keyed on the raw text: reset values and addresses repeat across registers, and a
+# value that is not a plain number must come back unnormalized.
+@lru_cache(maxsize=512)
 def _const_sv(value: str, width: int = 32) -> str:
     v = value.strip().lower()
     if v.startswith("0x"):
@@ -123,26 +177,38 @@ def _placeholder_body(clock: str, reset: str, active_low: bool) -> str:
     return f"@({clocking(clock)}) {_reset_disable(reset, active_low)} 1'b1 |-> 1'b1;"
 
 
-def _missing_signals(required: list[str], known_signals: set[str]) -> list[str]:
-    if not known_signals:
+def _missing_signals(required: list[str], known_signals: frozenset[str]) -> list[str]:
+    # An empty scan means "assume present"; issuperset settles the common all-known case in C.
+    if not known_signals or known_signals.issuperset(required):
         return []
     return [sig for sig in required if sig not in known_signals]
 
 
 def _resolve_signal_name(name: str, inputs: SynthesisInputs) -> str:
-    if name in inputs.signal_aliases:
-        return inputs.signal_aliases[name]
+    aliases = inputs.signal_aliases
+    if not aliases:
+        return name
+    out = inputs.resolved_names.get(name)
+    if out is None:
+        out = inputs.resolved_names[name] = _lookup_alias(name, aliases)
+    return out
+
+
+def _lookup_alias(name: str, aliases: dict[str, str]) -> str:
+    if name in aliases:
+        return aliases[name]
     low = name.lower()
-    if low in inputs.signal_aliases:
-        return inputs.signal_aliases[low]
+    if low in aliases:
+        return aliases[low]
     up = name.upper()
-    if up in inputs.signal_aliases:
-        return inputs.signal_aliases[up]
+    if up in aliases:
+        return aliases[up]
     return name
 
 
 def _apply_aliases(expr: str, inputs: SynthesisInputs) -> str:
-    if not inputs.signal_aliases:
+    probe = inputs.alias_probe
+    if probe is None or probe.search(expr.lower()) is None:
         return expr
 
     def repl(match: re.Match[str]) -> str:
@@ -152,49 +218,47 @@ def _apply_aliases(expr: str, inputs: SynthesisInputs) -> str:
     return _TOKEN_RE.sub(repl, expr)
 
 
-def _required_signals(required: list[str], inputs: SynthesisInputs) -> list[str]:
+def _required_signals(required: Iterable[str], inputs: SynthesisInputs) -> list[str]:
     return [_resolve_signal_name(sig, inputs) for sig in required]
 
 
-def _fallback_assert(
-    clause: SpecClause,
-    name: str,
-    clock: str,
-    reset: str,
-    active_low: bool,
-    reason: str,
-) -> PropertyCandidate:
+def _missing_identifiers(required: set[str], inputs: SynthesisInputs) -> list[str]:
+    """Missing signals for an identifier set, listed in sorted identifier order for the note."""
+    if not _missing_signals(_required_signals(required, inputs), inputs.known_signals):
+        return []
+    # Only a clause that falls back to a placeholder pays for the sort.
+    return _missing_signals(_required_signals(sorted(required), inputs), inputs.known_signals)
+
+
+def _fallback_assert(clause: SpecClause, name: str, inputs: SynthesisInputs, reason: str) -> PropertyCandidate:
     return _mk_assert(
         clause.clause_id,
         name,
-        _placeholder_body(clock, reset, active_low),
+        inputs.placeholder_body,
         source_clause=clause.clause_id,
         notes=reason,
     )
 
 
-def _extract_identifiers(expr: str) -> list[str]:
-    out: list[str] = []
-    for tok in _TOKEN_RE.findall(expr):
-        low = tok.lower()
-        if low in _SV_KEYWORDS:
-            continue
-        if low in _SV_SYSTEM_FUNCTIONS:
-            continue
-        # Skip base-literal tails like d0, hff, b1010 from 8'd0 / 8'hff.
-        if re.match(r"^[dhbo][0-9a-fxz_]+$", low):
-            continue
-        out.append(tok)
-    return out
+def _extract_identifiers(*exprs: str) -> set[str]:
+    """Distinct signal-like identifiers across `exprs` (keywords, system functions and literal tails dropped)."""
+    return {
+        tok
+        for expr in exprs
+        for tok in _TOKEN_RE.findall(expr)
+        if (low := tok.lower()) not in _NON_SIGNAL_WORDS
+        # Skip base-literal tails; a first-letter test rules out most tokens before the set scan.
+        and not (low[0] in "dhbo" and len(low) > 1 and _BASE_TAIL_CHARS.issuperset(low[1:]))
+    }
 
 
 def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> list[PropertyCandidate]:
     text = clause.text.strip()
     lower = text.lower()
-    disable = _reset_disable(inputs.reset, inputs.reset_active_low)
+    disable = inputs.disable
 
     # Pattern: "if a then b next cycle"
-    m = re.search(r"if\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+then\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+next\s+cycle", lower)
+    m = _IF_THEN_RE.search(lower) if "then" in lower and "cycle" in lower else None
     if m:
         cond, cons = _resolve_signal_name(m.group(1), inputs), _resolve_signal_name(m.group(2), inputs)
         missing = _missing_signals(_required_signals([cond, cons], inputs), inputs.known_signals)
@@ -203,13 +267,11 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     f"Signals not found in RTL: {', '.join(missing)}",
                 )
             ]
-        body = f"@({clocking(inputs.clock)}) {disable} {cond} |=> {cons};"
+        body = f"@({inputs.clock_event}) {disable} {cond} |=> {cons};"
         return [
             _mk_assert(
                 clause.clause_id,
@@ -220,7 +282,7 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
         ]
 
     # Pattern: "never a and b"
-    m = re.search(r"never\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+and\s+([a-zA-Z_][a-zA-Z0-9_]*)", lower)
+    m = _NEVER_RE.search(lower) if "never" in lower else None
     if m:
         a, b = _resolve_signal_name(m.group(1), inputs), _resolve_signal_name(m.group(2), inputs)
         missing = _missing_signals(_required_signals([a, b], inputs), inputs.known_signals)
@@ -229,13 +291,11 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     f"Signals not found in RTL: {', '.join(missing)}",
                 )
             ]
-        body = f"@({clocking(inputs.clock)}) {disable} !({a} && {b});"
+        body = f"@({inputs.clock_event}) {disable} !({a} && {b});"
         return [
             _mk_assert(
                 clause.clause_id,
@@ -246,10 +306,7 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
         ]
 
     # Pattern: "within N cycles" handshake-ish clause.
-    m = re.search(
-        r"([a-zA-Z_][a-zA-Z0-9_]*)\s+.*within\s+(\d+)\s+cycles\s+.*([a-zA-Z_][a-zA-Z0-9_]*)",
-        lower,
-    )
+    m = _WITHIN_RE.search(lower) if "within" in lower and "cycles" in lower else None
     if m:
         req, bound, ack = _resolve_signal_name(m.group(1), inputs), int(m.group(2)), _resolve_signal_name(m.group(3), inputs)
         missing = _missing_signals(_required_signals([req, ack], inputs), inputs.known_signals)
@@ -258,13 +315,11 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     f"Signals not found in RTL: {', '.join(missing)}",
                 )
             ]
-        body = f"@({clocking(inputs.clock)}) {disable} {req} |-> ##[0:{bound}] {ack};"
+        body = f"@({inputs.clock_event}) {disable} {req} |-> ##[0:{bound}] {ack};"
         return [
             _mk_assert(
                 clause.clause_id,
@@ -275,10 +330,7 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
         ]
 
     # Pattern: "x should be low/high right after reset"
-    m = re.search(
-        r"([a-zA-Z_][a-zA-Z0-9_]*)\s+should\s+be\s+(low|high)\s+right\s+after\s+reset",
-        lower,
-    )
+    m = _RESET_LEVEL_RE.search(lower) if "should" in lower and "after" in lower else None
     if m:
         sig, level = _resolve_signal_name(m.group(1), inputs), m.group(2)
         missing = _missing_signals(_required_signals([sig], inputs), inputs.known_signals)
@@ -287,16 +339,14 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     f"Signals not found in RTL: {', '.join(missing)}",
                 )
             ]
 
         expected = "1'b0" if level == "low" else "1'b1"
-        reset_expr = _reset_asserted(inputs.reset, inputs.reset_active_low)
-        body = f"@({clocking(inputs.clock)}) {reset_expr} |=> ({sig} == {expected});"
+        reset_expr = inputs.reset_asserted
+        body = f"@({inputs.clock_event}) {reset_expr} |=> ({sig} == {expected});"
         return [
             _mk_assert(
                 clause.clause_id,
@@ -310,9 +360,7 @@ def _text_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> l
         _fallback_assert(
             clause,
             f"{clause.clause_id}_placeholder",
-            inputs.clock,
-            inputs.reset,
-            inputs.reset_active_low,
+            inputs,
             f"Unable to derive strict logic from clause: {text}",
         )
     ]
@@ -333,15 +381,13 @@ def _register_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs)
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_{reg_sig}_reset_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     f"Register signal mapping missing: {', '.join(missing)}",
                 )
             )
         else:
-            reset_expr = _reset_asserted(inputs.reset, inputs.reset_active_low)
-            body = f"@({clocking(inputs.clock)}) {reset_expr} |=> {reg_sig} == {_const_sv(reset_value, width)};"
+            reset_expr = inputs.reset_asserted
+            body = f"@({inputs.clock_event}) {reset_expr} |=> {reg_sig} == {_const_sv(reset_value, width)};"
             candidates.append(
                 _mk_assert(
                     clause.clause_id,
@@ -362,9 +408,7 @@ def _register_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs)
                 _fallback_assert(
                     clause,
                     f"{clause.clause_id}_{reg_sig}_ro_placeholder",
-                    inputs.clock,
-                    inputs.reset,
-                    inputs.reset_active_low,
+                    inputs,
                     "Read-only check requires sw_we_signal, sw_addr_signal, and register address mapping.",
                 )
             )
@@ -378,16 +422,14 @@ def _register_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs)
                     _fallback_assert(
                         clause,
                         f"{clause.clause_id}_{reg_sig}_ro_placeholder",
-                        inputs.clock,
-                        inputs.reset,
-                        inputs.reset_active_low,
+                        inputs,
                         f"Read-only mapping references unknown signals: {', '.join(missing)}",
                     )
                 )
             else:
                 addr_const = _const_sv(str(address), sw_addr_width)
                 body = (
-                    f"@({clocking(inputs.clock)}) {_reset_disable(inputs.reset, inputs.reset_active_low)} "
+                    f"@({inputs.clock_event}) {inputs.disable} "
                     f"({sw_we_resolved} && ({sw_addr_resolved} == {addr_const})) |-> $stable({reg_sig});"
                 )
                 candidates.append(
@@ -405,19 +447,19 @@ def _register_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs)
 def _rule_table_clause_to_candidates(clause: SpecClause, inputs: SynthesisInputs) -> list[PropertyCandidate]:
     condition = _apply_aliases(str(clause.metadata.get("condition", "")).strip(), inputs)
     guarantee = _apply_aliases(str(clause.metadata.get("guarantee", "")).strip(), inputs)
-    disable = _reset_disable(inputs.reset, inputs.reset_active_low)
+    disable = inputs.disable
 
     if not condition or not guarantee:
-        body = _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low)
+        body = inputs.placeholder_body
         note = "Rule row missing condition or guarantee"
     else:
-        required = _extract_identifiers(condition) + _extract_identifiers(guarantee)
-        missing = _missing_signals(_required_signals(sorted(set(required)), inputs), inputs.known_signals)
+        required = _extract_identifiers(condition, guarantee)
+        missing = _missing_identifiers(required, inputs)
         if missing:
-            body = _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low)
+            body = inputs.placeholder_body
             note = f"Rule references unknown signals: {', '.join(missing)}"
         else:
-            body = f"@({clocking(inputs.clock)}) {disable} ({condition}) |-> ({guarantee});"
+            body = f"@({inputs.clock_event}) {disable} ({condition}) |-> ({guarantee});"
             note = None
 
     return [
@@ -439,39 +481,32 @@ def _inline_library_candidate(pattern: LibraryPattern, inputs: SynthesisInputs)
             _mk_assert(
                 "lib_inline",
                 str(o.get("name", "lib_inline_placeholder")),
-                _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                inputs.placeholder_body,
                 notes="Inline property requires `expr`",
             )
         ]
 
     when = _apply_aliases(str(o.get("when", "")).strip(), inputs)
-    required = _extract_identifiers(expr)
-    if when:
-        required += _extract_identifiers(when)
-
-    missing = _missing_signals(_required_signals(sorted(set(required)), inputs), inputs.known_signals)
+    required = _extract_identifiers(expr, when)
+    missing = _missing_identifiers(required, inputs)
     if missing:
         return [
             _mk_assert(
                 "lib_inline",
                 str(o.get("name", "lib_inline_placeholder")),
-                _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                inputs.placeholder_body,
                 notes=f"Inline property references unknown signals: {', '.join(missing)}",
             )
         ]
 
-    disable = _reset_disable(inputs.reset, inputs.reset_active_low)
+    disable = inputs.disable
     if when:
-        body = f"@({clocking(inputs.clock)}) {disable} ({when}) |-> ({expr});"
+        body = f"@({inputs.clock_event}) {disable} ({when}) |-> ({expr});"
     else:
-        body = f"@({clocking(inputs.clock)}) {disable} ({expr});"
+        body = f"@({inputs.clock_event}) {disable} ({expr});"
 
     raw_kind = str(o.get("property_kind", "assert")).strip().lower()
-    kind: Literal["assert", "assume", "cover"]
-    if raw_kind in {"assert", "assume", "cover"}:
-        kind = raw_kind  # type: ignore[assignment]
-    else:
-        kind = "assert"
+    kind = _PROPERTY_KINDS.get(raw_kind, "assert")
 
     return [
         _mk_property(
@@ -505,77 +540,77 @@ def _canonical_10_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -
     bound = int(o.get("bound", 4))
     level_width = int(o.get("level_width", 8))
 
-    disable = _reset_disable(inputs.reset, inputs.reset_active_low)
-    reset_asserted = _reset_asserted(inputs.reset, inputs.reset_active_low)
+    disable = inputs.disable
+    reset_asserted = inputs.reset_asserted
 
     specs: list[tuple[str, str, str, Literal["assert", "assume", "cover"], str | None]] = [
         (
             "c10_01_req_ack_within_bound",
             "c10_01_req_ack_within_bound",
-            f"@({clocking(inputs.clock)}) {disable} {req} |-> ##[0:{bound}] {ack};",
+            f"@({inputs.clock_event}) {disable} {req} |-> ##[0:{bound}] {ack};",
             "assert",
             "Handshake eventual ack within bound.",
         ),
         (
             "c10_02_ack_has_req",
             "c10_02_ack_has_req",
-            f"@({clocking(inputs.clock)}) {disable} {ack} |-> ({req} || $past({req}));",
+            f"@({inputs.clock_event}) {disable} {ack} |-> ({req} || $past({req}));",
             "assert",
             "Ack should correspond to a current or prior request.",
         ),
         (
             "c10_03_req_held_until_ack",
             "c10_03_req_held_until_ack",
-            f"@({clocking(inputs.clock)}) {disable} ({req} && !{ack}) |=> {req};",
+            f"@({inputs.clock_event}) {disable} ({req} && !{ack}) |=> {req};",
             "assert",
             "Request remains asserted until acknowledged.",
         ),
         (
             "c10_04_no_spurious_push_pop",
             "c10_04_no_spurious_push_pop",
-            f"@({clocking(inputs.clock)}) {disable} !({push} && {pop} && {empty});",
+            f"@({inputs.clock_event}) {disable} !({push} && {pop} && {empty});",
             "assert",
             "Avoid invalid simultaneous pop on empty while push/pop toggles.",
         ),
         (
             "c10_05_no_overflow",
             "c10_05_no_overflow",
-            f"@({clocking(inputs.clock)}) {disable} !({full} && {push});",
+            f"@({inputs.clock_event}) {disable} !({full} && {push});",
             "assert",
             "FIFO overflow safety.",
         ),
         (
             "c10_06_no_underflow",
             "c10_06_no_underflow",
-            f"@({clocking(inputs.clock)}) {disable} !({empty} && {pop});",
+            f"@({inputs.clock_event}) {disable} !({empty} && {pop});",
             "assert",
             "FIFO underflow safety.",
         ),
         (
             "c10_07_level_flag_empty",
             "c10_07_level_flag_empty",
-            f"@({clocking(inputs.clock)}) {disable} ({empty}) |-> ({level} == {level_width}'d0);",
+            f"@({inputs.clock_event}) {disable} ({empty}) |-> ({level} == {level_width}'d0);",
             "assert",
             "Empty flag implies level == 0.",
         ),
         (
             "c10_08_level_flag_full",
             "c10_08_level_flag_full",
-            f"@({clocking(inputs.clock)}) {disable} ({full}) |-> ({level} == {_const_sv(level_max, level_width)});",
+            f"@({inputs.clock_event}) {disable} ({full}) |-> ({level} == {_const_sv(level_max, level_width)});",
             "assert",
             "Full flag implies level == max.",
         ),
         (
             "c10_09_reset_valid_low",
             "c10_09_reset_valid_low",
-            f"@({clocking(inputs.clock)}) {reset_asserted} |=> ({valid} == 1'b0);",
+            f"@({inputs.clock_event}) {reset_asserted} |=> ({valid} == 1'b0);",
             "assert",
             "Reset safety on output valid.",
         ),
         (
             "c10_10_cover_req_ack_cycle",
             "c10_10_cover_req_ack_cycle",
-            f"@({clocking(inputs.clock)}) {disable} {req} ##[1:{bound}] {ack};",
+            f"@({inputs.clock_event}) {disable} {req} ##[1:{bound}] {ack};",
             "cover",
             "Coverage: observe request-to-ack scenario.",
         ),
@@ -585,13 +620,13 @@ def _canonical_10_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -
     for prop_id, name, body, kind, note in specs:
         aliased_body = _apply_aliases(body, inputs)
         required = _extract_identifiers(aliased_body)
-        missing = _missing_signals(_required_signals(sorted(set(required)), inputs), inputs.known_signals)
+        missing = _missing_identifiers(required, inputs)
         if missing:
             out.append(
                 _mk_assert(
                     prop_id,
                     f"{name}_placeholder",
-                    _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                    inputs.placeholder_body,
                     notes=f"canonical_10 missing signals: {', '.join(missing)}",
                 )
             )
@@ -610,7 +645,7 @@ def _canonical_10_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -
 
 
 def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> list[PropertyCandidate]:
-    disable = _reset_disable(inputs.reset, inputs.reset_active_low)
+    disable = inputs.disable
     kind = pattern.kind.lower()
     o = pattern.options
     candidates: list[PropertyCandidate] = []
@@ -625,7 +660,7 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     f"lib_hs_{req}_{ack}",
                     f"lib_hs_{req}_{ack}_placeholder",
-                    _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                    inputs.placeholder_body,
                     notes=f"Handshake mapping missing signals: {', '.join(missing)}",
                 )
             )
@@ -634,7 +669,7 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     f"lib_hs_{req}_{ack}",
                     f"lib_hs_{req}_{ack}_eventual",
-                    f"@({clocking(inputs.clock)}) {disable} {req} |-> ##[0:{bound}] {ack};",
+                    f"@({inputs.clock_event}) {disable} {req} |-> ##[0:{bound}] {ack};",
                     notes="Reusable handshake liveness/safety intent",
                 )
             )
@@ -651,7 +686,7 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     "lib_fifo_safety",
                     "lib_fifo_safety_placeholder",
-                    _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                    inputs.placeholder_body,
                     notes=f"FIFO mapping missing signals: {', '.join(missing)}",
                 )
             )
@@ -660,7 +695,7 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     "lib_fifo_overflow",
                     "lib_fifo_no_overflow",
-                    f"@({clocking(inputs.clock)}) {disable} !({full} && {push});",
+                    f"@({inputs.clock_event}) {disable} !({full} && {push});",
                     notes="Prevent push when FIFO is full",
                 )
             )
@@ -668,7 +703,7 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     "lib_fifo_underflow",
                     "lib_fifo_no_underflow",
-                    f"@({clocking(inputs.clock)}) {disable} !({empty} && {pop});",
+                    f"@({inputs.clock_event}) {disable} !({empty} && {pop});",
                     notes="Prevent pop when FIFO is empty",
                 )
             )
@@ -684,17 +719,17 @@ def _library_candidates(pattern: LibraryPattern, inputs: SynthesisInputs) -> lis
                 _mk_assert(
                     f"lib_rst_{signal}",
                     f"lib_reset_seq_{signal}_placeholder",
-                    _placeholder_body(inputs.clock, inputs.reset, inputs.reset_active_low),
+                    inputs.placeholder_body,
                     notes=f"Reset-sequence signal missing: {', '.join(missing)}",
                 )
             )
         else:
-            reset_asserted = _reset_asserted(inputs.reset, inputs.reset_active_low)
+            reset_asserted = inputs.reset_asserted
             candidates.append(
                 _mk_assert(
                     f"lib_rst_{signal}",
                     f"lib_reset_seq_{signal}",
-                    f"@({clocking(inputs.clock)}) {reset_asserted} |=> ##[{latency}:{latency}] ({signal} == {value});",
+                    f"@({inputs.clock_event}) {reset_asserted} |=> ##[{latency}:{latency}] ({signal} == {value});",
                     notes="Reset sequencing rule",
                 )
             )
@@ -716,8 +751,17 @@ def synthesize_candidates(
     libraries: list[LibraryPattern],
     inputs: SynthesisInputs,
 ) -> list[PropertyCandidate]:
-    out: list[PropertyCandidate] = []
+    return list(iter_candidates(clauses, libraries, inputs))
+
+
+def iter_candidates(
+    clauses: list[SpecClause],
+    libraries: list[LibraryPattern],
+    inputs: SynthesisInputs,
+) -> Iterator[PropertyCandidate]:
+    """Yield `synthesize_candidates` results one at a time, already uniquely named."""
     seen_names: set[str] = set()
+    next_suffix: dict[str, int] = {}
 
     for clause in clauses:
         if "register" in clause.tags or "ipxact" in clause.tags:
@@ -728,52 +772,55 @@ def synthesize_candidates(
             props = _text_clause_to_candidates(clause, inputs)
 
         for prop in props:
-            name = prop.name
-            i = 2
-            while name in seen_names:
-                name = f"{prop.name}_{i}"
-                i += 1
-            prop.name = name
-            seen_names.add(name)
-            out.append(prop)
+            _claim_unique_name(prop, seen_names, next_suffix)
+            yield prop
 
     for lib in libraries:
         for prop in _library_candidates(lib, inputs):
-            name = prop.name
-            i = 2
-            while name in seen_names:
-                name = f"{prop.name}_{i}"
-                i += 1
-            prop.name = name
-            seen_names.add(name)
-            out.append(prop)
-
-    return out
+            _claim_unique_name(prop, seen_names, next_suffix)
+            yield prop
+
+
+def _claim_unique_name(prop: PropertyCandidate, seen_names: set[str], next_suffix: dict[str, int]) -> None:
+    """Rename `prop` to the first free of name, name_2, name_3, ... and record it as taken."""
+    base = prop.name
+    name = base
+    if name in seen_names:
+        # Names are never released, so every suffix below the last one handed out
+        # for this base is still taken; resume there instead of probing from _2.
+        i = next_suffix.get(base, 2)
+        name = f"{base}_{i}"
+        while name in seen_names:
+            i += 1
+            name = f"{base}_{i}"
+        next_suffix[base] = i + 1
+        prop.name = name
+    seen_names.add(name)
 
 
 def serialize_sva(candidates: list[PropertyCandidate]) -> str:
-    lines: list[str] = []
-    lines.append("`ifdef FORMAL")
-    lines.append("")
+    return "".join(_iter_sva_blocks(candidates))
+
+
+def _iter_sva_blocks(candidates: list[PropertyCandidate]) -> Iterator[str]:
+    # One newline-terminated block per candidate.
+    yield "`ifdef FORMAL\n\n"
     for c in candidates:
-        lines.append(f"// FC_ID: {c.prop_id}")
-        if c.source_clause:
-            lines.append(f"// SOURCE: {c.source_clause}")
-        if c.notes:
-            lines.append(f"// NOTE: {c.notes}")
-        lines.append(f"property {c.name};")
-        lines.append(f"  {c.body}")
-        lines.append("endproperty")
-        lines.append(f"{c.kind} property ({c.name});")
-        lines.append("")
-    lines.append("`endif")
-    lines.append("")
-    return "\n".join(lines)
+        yield (
+            f"// FC_ID: {c.prop_id}\n"
+            + (f"// SOURCE: {c.source_clause}\n" if c.source_clause else "")
+            + (f"// NOTE: {c.notes}\n" if c.notes else "")
+            + f"property {c.name};\n  {c.body}\nendproperty\n{c.kind} property ({c.name});\n\n"
+        )
+    yield "`endif\n"
 
 
 def write_candidate_file(path: Path, candidates: list[PropertyCandidate]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(serialize_sva(candidates), encoding="utf-8")
+    # Streamed through the file buffer, so the whole document never exists as one
+    # str plus its UTF-8 copy; newline="" keeps "\n" untranslated on every platform.
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.writelines(_iter_sva_blocks(candidates))
 
 
 def is_placeholder_candidate(candidate: PropertyCandidate) -> bool:
@@ -783,7 +830,7 @@ def is_placeholder_candidate(candidate: PropertyCandidate) -> bool:
     return "1'b1 |-> 1'b1" in candidate.body
 
 
-def optimize_candidates(candidates: list[PropertyCandidate], max_placeholders: int = 3) -> list[PropertyCandidate]:
+def optimize_candidates(candidates: Iterable[PropertyCandidate], max_placeholders: int = 3) -> list[PropertyCandidate]:
     """
     Reduce noise while preserving diversity:
     - remove duplicate property bodies
@@ -793,12 +840,14 @@ def optimize_candidates(candidates: list[PropertyCandidate], max_placeholders: i
     seen: set[tuple[str, str]] = set()
     placeholder_count = 0
     for c in candidates:
-        sig = (c.kind, c.body.strip())
+        body = c.body.strip()
+        sig = (c.kind, body)
         if sig in seen:
             continue
         seen.add(sig)
 
-        if is_placeholder_candidate(c):
+        # is_placeholder_candidate, inlined; the marker has no edge whitespace, so the stripped body serves.
+        if "1'b1 |-> 1'b1" in body or (c.notes and "placeholder" in c.notes.lower()):
             if placeholder_count >= max_placeholders:
                 continue
             placeholder_count += 1
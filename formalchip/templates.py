@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -7,13 +9,15 @@ _TEMPLATE_ROOT = Path(__file__).resolve().parent / "templates" / "engines"
 
 
 def supported_engine_templates() -> list[str]:
-    out: list[str] = []
+    return list(_template_names())
+
+
+@lru_cache(maxsize=1)
+def _template_names() -> tuple[str, ...]:
+    # Packaged data: the directory listing cannot change while the process runs.
     if not _TEMPLATE_ROOT.exists():
-        return out
-    for p in sorted(_TEMPLATE_ROOT.iterdir()):
-        if p.is_dir():
-            out.append(p.name)
-    return out
+        return ()
+    return tuple(p.name for p in sorted(_TEMPLATE_ROOT.iterdir()) if p.is_dir())
 
 
 def export_engine_template(engine: str, output_path: Path) -> Path:
@@ -24,6 +28,6 @@ def export_engine_template(engine: str, output_path: Path) -> Path:
         raise ValueError(f"No template for engine '{engine}'. Supported: {supported}")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+    # Byte copy (sendfile on Linux); the packaged templates are UTF-8 with LF endings.
+    shutil.copyfile(src, output_path)
     return output_path
-
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 import hashlib
 import json
+import mmap
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
+
+try:  # optional fast JSON encoder/decoder
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    _orjson = None
+
+
+# (epoch second, formatted stamp): the stamp has second resolution, so calls within
+# the same second reuse the string instead of building and formatting a datetime.
+_LAST_STAMP: tuple[int, str] = (-1, "")
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    global _LAST_STAMP
+    sec = int(time.time())
+    last_sec, stamp = _LAST_STAMP
+    if sec != last_sec:
+        stamp = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+        _LAST_STAMP = (sec, stamp)
+    return stamp
 
 
 def ensure_dir(path: Path) -> Path:
@@ -23,7 +46,95 @@ def ensure_dir(path: Path) -> Path:
 
 def write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Written beside the target and renamed over it, so readers see the old or the new
+    # document, never a torn one.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        payload = _dumps_pretty_orjson(data)
+        if payload is not None:
+            tmp.write_bytes(payload)
+        else:
+            # Stream the stdlib encoder's chunks instead of materializing one str and its UTF-8 copy.
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+                f.write("\n")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _dumps_pretty_orjson(data: Any) -> bytes | None:
+    # Only used when the bytes would equal json.dump's: report and evidence files are
+    # hashed, so the optional encoder must not change their contents.
+    if _orjson is None or not _is_plain_json(data):
+        return None
+    try:
+        # The trailing newline is appended by orjson, not by concatenating a second copy.
+        payload = _orjson.dumps(
+            data,
+            option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS | _orjson.OPT_APPEND_NEWLINE,
+        )
+    except _orjson.JSONEncodeError:
+        # e.g. >64-bit ints.
+        return None
+    # json.dump escapes everything outside printable ASCII; orjson writes it raw.
+    if not payload.isascii() or b"\x7f" in payload:
+        return None
+    return payload
+
+
+def _is_plain_json(data: Any) -> bool:
+    """True if orjson and json.dump encode ``data`` identically (str keys, finite fixed-notation floats)."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind is dict:
+            if not all(type(k) is str for k in obj):
+                return False
+            stack.extend(obj.values())
+        elif kind is list or kind is tuple:
+            stack.extend(obj)
+        elif kind is float:
+            # orjson writes NaN/Infinity as null and exponents without "+" or zero padding.
+            if obj != 0.0 and not (1e-4 <= abs(obj) < 1e16):
+                return False
+        elif kind is not str and kind is not int and kind is not bool and obj is not None:
+            return False
+    return True
+
+
+def read_json(path: Path) -> Any:
+    # Both decoders take UTF-8 bytes directly, skipping a str decode round-trip.
+    return loads_json(path.read_bytes())
+
+
+def loads_json(data: bytes | str) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and >64-bit ints that stdlib json accepts.
+            pass
+    return json.loads(data)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Compact single-line UTF-8 JSON; dataclass instances serialize as their fields."""
+    if _orjson is not None:
+        try:
+            # orjson walks dataclasses natively, with no intermediate asdict() copy.
+            return _orjson.dumps(data)
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, default=_dataclass_fields).encode("utf-8")
+
+
+def _dataclass_fields(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def append_jsonl(path: Path, data: Any) -> None:
@@ -32,16 +143,136 @@ def append_jsonl(path: Path, data: Any) -> None:
         f.write(json.dumps(data, sort_keys=True) + "\n")
 
 
+_MMAP_HASH_MIN_BYTES = 16 * 1024 * 1024
+
+
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    # Unbuffered: file_digest and the fallback loop read straight into their own
+    # buffers, with no BufferedReader copy in between.
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_HASH_MIN_BYTES:
+            # Hash the page-cache mapping directly instead of copying through read() buffers.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        # One buffer refilled in place; no bytes object per chunk.
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.hexdigest()
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Place `src` at `dst` (replacing it), as a hard link where the filesystem allows."""
+    # Witness files can be hundreds of MB; a hard link is a metadata-only operation.
+    # copy2 (kernel-side sendfile on Linux) covers filesystems without links.
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+_T = TypeVar("_T")
+
+# One entry per (parser, path), least recently used first. The entry remembers the
+# file's mtime/size and the parser arguments it was built from.
+_PARSE_CACHE: OrderedDict[tuple[Callable[..., Any], Path], tuple[int, int, tuple[Any, ...], Any]] = OrderedDict()
+_PARSE_CACHE_MAX = 256
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def parse_file_cached(path: Path, parse: Callable[..., _T], *args: Any) -> _T:
+    """
+    Return a private deep copy of ``parse(path, *args)``, reusing the previous parse of
+    `path` while its mtime and size are unchanged and `args` compare equal. Configs,
+    specs, RTL and KPI inputs are re-read several times per command (doctor preflight,
+    the loop, reporting), so each unchanged file is parsed once. A rewritten file
+    replaces its entry. Callers own what they get back, so mutating a result never
+    leaks into the cache or another caller's copy.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        # Let the parser report the missing/unreadable file as it always has.
+        return parse(path, *args)
+    key = (parse, path)
+    with _PARSE_CACHE_LOCK:
+        hit = _PARSE_CACHE.get(key)
+        if hit is not None and hit[:3] == (st.st_mtime_ns, st.st_size, args):
+            _PARSE_CACHE.move_to_end(key)
+            return copy.deepcopy(hit[3])
+    # Parsed outside the lock: callers on a thread pool overlap their file reads.
+    result = parse(path, *args)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(args), copy.deepcopy(result))
+        _PARSE_CACHE.move_to_end(key)
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+            _PARSE_CACHE.popitem(last=False)
+    return result
+
+
+def csv_column_index(header: list[str], name: str) -> int | None:
+    """Position of column `name` in a CSV header, or None if absent."""
+    # DictReader semantics: with a duplicated column name, the last one wins.
+    for idx in range(len(header) - 1, -1, -1):
+        if header[idx] == name:
+            return idx
+    return None
+
+
+def walk_files(root: Path, skip_top_dirs: frozenset[str] = frozenset()) -> list[tuple[str, os.DirEntry[str]]]:
+    """
+    List non-directory entries under `root` as (relative path, DirEntry) pairs, ordered
+    like sorted(root.rglob("*")). Directory entries carry their file type from the
+    dirent, so classifying them costs no extra stat calls. Top-level directories named
+    in `skip_top_dirs` are not descended into.
+    """
+    out: list[tuple[str, os.DirEntry[str]]] = []
+    stack = [(str(root), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir():
+                    # Like rglob, never descend through directory symlinks.
+                    if not entry.is_symlink() and not (not prefix and entry.name in skip_top_dirs):
+                        stack.append((entry.path, rel + os.sep))
+                    continue
+                out.append((rel, entry))
+    out.sort(key=lambda item: item[0].split(os.sep))
+    return out
+
+
+# Tool versions probed so far in this process, by engine name; reused by evidence packs.
+_TOOL_VERSIONS: dict[str, str] = {}
+
+
+def register_tool_version(name: str, version: str) -> str:
+    _TOOL_VERSIONS[name] = version
+    return version
+
+
+def known_tool_versions() -> dict[str, str]:
+    return dict(_TOOL_VERSIONS)
 
 
 def which_or_none(exe: str) -> str | None:
-    return shutil.which(exe)
+    return _which_cached(exe, os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=256)
+def _which_cached(exe: str, path_env: str) -> str | None:
+    # PATH is part of the key so an edited environment triggers a fresh search.
+    return shutil.which(exe, path=path_env or None)
 
 
 def run_command(cmd: list[str], cwd: Path | None = None, timeout_s: int = 600) -> tuple[int, str, str]:
@@ -56,11 +287,41 @@ def run_command(cmd: list[str], cwd: Path | None = None, timeout_s: int = 600) -
     return proc.returncode, proc.stdout, proc.stderr
 
 
+def run_command_to_file(
+    cmd: list[str],
+    log_path: Path,
+    cwd: Path | None = None,
+    timeout_s: int = 600,
+    env: dict[str, str] | None = None,
+) -> int:
+    """Run `cmd` with stdout and stderr streamed straight into `log_path`; return the exit code."""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("wb") as log:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            timeout=timeout_s,
+            check=False,
+            env=env,
+        )
+    return proc.returncode
+
+
 def gather_runtime_facts() -> dict[str, Any]:
+    python, python_exe, platform_name = _static_runtime_facts()
     return {
-        "python": sys.version,
-        "python_exe": sys.executable,
-        "platform": platform.platform(),
+        "python": python,
+        "python_exe": python_exe,
+        "platform": platform_name,
         "cwd": os.getcwd(),
     }
 
+
+@lru_cache(maxsize=1)
+def _static_runtime_facts() -> tuple[str, str, str]:
+    # platform.platform() shells out to uname and parses os-release; none of this
+    # changes within a process, unlike the working directory.
+    return sys.version, sys.executable, platform.platform()
+
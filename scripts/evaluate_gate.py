@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
+"""Evaluate the FormalChip KPI gate for one or more run directories (CI entry point).
+
+    python3 scripts/evaluate_gate.py --run-dir RUN_DIR [--run-dir RUN_DIR ...]
+        [--config formalchip.toml] [--baseline-csv study.csv] [--out gate_eval.json]
+
+With a single --run-dir the output is one JSON object; with several it is a JSON
+list holding one such object per run, in argument order. The exit code is 0 when
+every run passes the gate and 2 otherwise.
+"""
 from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
 from formalchip.config import load_config
@@ -11,32 +21,49 @@ from formalchip.kpi import compute_kpi_report
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Evaluate FormalChip gate/KPI policy for CI")
-    parser.add_argument("--run-dir", required=True)
+    parser.add_argument(
+        "--run-dir",
+        required=True,
+        action="append",
+        help="Run directory to evaluate; repeat to gate several runs against one config/baseline",
+    )
     parser.add_argument("--config", required=False)
     parser.add_argument("--baseline-csv", required=False)
     parser.add_argument("--out", required=False)
     args = parser.parse_args()
 
+    # Config and baseline study are loaded once for every run dir.
     policy = load_config(args.config).kpi if args.config else None
     baseline = Path(args.baseline_csv).resolve() if args.baseline_csv else None
 
-    report = compute_kpi_report(Path(args.run_dir).resolve(), policy=policy, baseline_csv=baseline)
-    payload = {
-        "run_id": report.get("run_id"),
-        "overall_success": report.get("overall_success"),
-        "gate_verdict": report.get("gate_verdict"),
-        "bug_or_coverage_achieved": report.get("bug_or_coverage_achieved"),
-        "meets_time_reduction_target": report.get("meets_time_reduction_target"),
-        "output": report.get("output"),
-    }
+    payloads = []
+    all_success = True
+    for run_dir in args.run_dir:
+        report = compute_kpi_report(Path(run_dir).resolve(), policy=policy, baseline_csv=baseline)
+        payloads.append(
+            {
+                "run_id": report.get("run_id"),
+                "overall_success": report.get("overall_success"),
+                "gate_verdict": report.get("gate_verdict"),
+                "bug_or_coverage_achieved": report.get("bug_or_coverage_achieved"),
+                "meets_time_reduction_target": report.get("meets_time_reduction_target"),
+                "output": report.get("output"),
+            }
+        )
+        all_success = all_success and bool(report.get("overall_success"))
+
+    # A single run keeps the original object-shaped output.
+    result = payloads[0] if len(payloads) == 1 else payloads
 
+    # Serialized once; the --out file and stdout get the same text.
+    text = json.dumps(result, indent=2, sort_keys=True) + "\n"
     if args.out:
         out = Path(args.out).resolve()
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        out.write_text(text, encoding="utf-8")
 
-    print(json.dumps(payload, indent=2, sort_keys=True))
-    return 0 if bool(report.get("overall_success")) else 2
+    sys.stdout.write(text)
+    return 0 if all_success else 2
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from formalchip.config import load_config
+
+
+class ConfigTests(unittest.TestCase):
+    def test_reload_picks_up_edited_config(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cfg = Path(td) / "formalchip.toml"
+            cfg.write_text(
+                '[project]\nrtl_files = ["rtl/top.sv"]\ntop_module = "top"\n',
+                encoding="utf-8",
+            )
+            first = load_config(cfg)
+            self.assertEqual(first.project.top_module, "top")
+            self.assertEqual(load_config(cfg).project.top_module, "top")
+
+            cfg.write_text(
+                '[project]\nrtl_files = ["rtl/top.sv"]\ntop_module = "core_top"\n',
+                encoding="utf-8",
+            )
+            self.assertEqual(load_config(cfg).project.top_module, "core_top")
+
+    def test_nested_options_are_not_shared_between_loads(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cfg = Path(td) / "formalchip.toml"
+            cfg.write_text(
+                '[project]\nrtl_files = ["rtl/top.sv"]\ntop_module = "top"\n\n'
+                '[[libraries]]\nkind = "inline"\nextra = { tags = ["a"] }\n',
+                encoding="utf-8",
+            )
+            first = load_config(cfg)
+            first.libraries[0].options["extra"]["tags"].append("b")
+
+            self.assertEqual(load_config(cfg).libraries[0].options["extra"], {"tags": ["a"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,10 @@ path = "spec/control.md"
             self.assertTrue(report.ok)
             self.assertGreater(report.candidate_count, 0)
 
+            fast = run_doctor(cfg, deep=False)
+            self.assertTrue(fast.ok)
+            self.assertEqual(fast.candidate_count, 0)
+
     def test_doctor_reports_missing_rtl(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from formalchip.evidence import build_evidence_pack
+
+# Stand-ins for pigz: a stdin->stdout gzip filter and one that dies before reading.
+_GZIP_FILTER = """
+import gzip, shutil, sys
+with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb", compresslevel=6) as out:
+    shutil.copyfileobj(sys.stdin.buffer, out)
+"""
+_FAILING = """
+import sys
+sys.stderr.write("pigz: out of space\\n")
+sys.exit(3)
+"""
+
+
+def _fake_pigz(bin_dir: Path, body: str) -> None:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    exe = bin_dir / "pigz"
+    exe.write_text(f"#!{sys.executable}\n{body}", encoding="utf-8")
+    exe.chmod(0o755)
+
+
+def _make_run_dir(root: Path) -> Path:
+    run_dir = root / "run"
+    (run_dir / "iter_01").mkdir(parents=True)
+    (run_dir / "state.json").write_text('{"run_id": "run"}\n', encoding="utf-8")
+    (run_dir / "iter_01" / "engine.log").write_text("PASS\n" * 1000, encoding="utf-8")
+    (run_dir / "iter_01" / "trace.bin").write_bytes(os.urandom(1 << 20))
+    return run_dir
+
+
+def _members(pack: Path) -> dict[str, bytes | None]:
+    with tarfile.open(pack, "r:gz") as tar:
+        out: dict[str, bytes | None] = {}
+        for info in tar:
+            fh = tar.extractfile(info)
+            # The manifest carries a timestamp; only its presence is compared.
+            out[info.name] = fh.read() if fh is not None and not info.name.endswith("manifest.json") else None
+        return out
+
+
+class EvidencePackTests(unittest.TestCase):
+    def test_stdlib_gzip_fallback_matches_pigz_pack(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            run_dir = _make_run_dir(root)
+            config = root / "formalchip.toml"
+            config.write_text("", encoding="utf-8")
+            _fake_pigz(root / "bin", _GZIP_FILTER)
+            (root / "empty").mkdir()
+
+            with mock.patch.dict(os.environ, {"PATH": str(root / "bin")}):
+                piped = build_evidence_pack(run_dir, config, {"sby": "test"}, output_path=root / "piped.tar.gz")
+            with mock.patch.dict(os.environ, {"PATH": str(root / "empty")}):
+                fallback = build_evidence_pack(run_dir, config, {"sby": "test"}, output_path=root / "fallback.tar.gz")
+
+            expected = _members(piped)
+            self.assertIn("evidence/manifest.json", expected)
+            self.assertIn("iter_01/trace.bin", expected)
+            self.assertEqual(_members(fallback), expected)
+
+    def test_pigz_failure_reports_status_and_stderr(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            run_dir = _make_run_dir(root)
+            _fake_pigz(root / "bin", _FAILING)
+
+            with mock.patch.dict(os.environ, {"PATH": str(root / "bin")}):
+                with self.assertRaises(RuntimeError) as ctx:
+                    build_evidence_pack(run_dir, root / "missing.toml", {"sby": "test"})
+            self.assertIn("status 3", str(ctx.exception))
+            self.assertIn("out of space", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
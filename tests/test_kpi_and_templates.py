@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -8,7 +12,9 @@ from formalchip.cli import main
 from formalchip.config import load_config
 from formalchip.kpi import compute_kpi_report
 from formalchip.loop import run_formalchip
+from formalchip.reporting import load_gate_verdict, load_report
 from formalchip.templates import export_engine_template, supported_engine_templates
+from formalchip.util import write_json
 
 
 class KPIAndTemplateTests(unittest.TestCase):
@@ -27,6 +33,51 @@ class KPIAndTemplateTests(unittest.TestCase):
             self.assertIn("overall_success", report)
             self.assertTrue((run_dir / "report" / "kpi.json").exists())
 
+    def test_evaluate_gate_script_output_shape(self) -> None:
+        repo = Path(__file__).resolve().parent.parent
+        script = repo / "scripts" / "evaluate_gate.py"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(repo), os.environ.get("PYTHONPATH")]))}
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self.assertEqual(main(["init", str(root)]), 0)
+            cfg = load_config(root / "formalchip.toml")
+            run_dir = str(cfg.loop.workdir / run_formalchip(cfg).run_id)
+
+            def evaluate(*dirs: str) -> object:
+                args = [arg for d in dirs for arg in ("--run-dir", d)]
+                proc = subprocess.run(
+                    [sys.executable, str(script), *args, "--config", str(root / "formalchip.toml")],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    check=False,
+                )
+                self.assertIn(proc.returncode, (0, 2), proc.stderr)
+                return json.loads(proc.stdout)
+
+            single = evaluate(run_dir)
+            self.assertIsInstance(single, dict)
+            batch = evaluate(run_dir, run_dir)
+            self.assertIsInstance(batch, list)
+            self.assertEqual(len(batch), 2)
+            for item in batch:
+                self.assertEqual(set(item), set(single))
+                self.assertEqual(item["run_id"], single["run_id"])
+
+    def test_loaded_reports_are_not_shared_between_calls(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            run_dir = Path(td) / "run"
+            write_json(run_dir / "report" / "summary.json", {"run_id": "run", "iterations": 1})
+            write_json(run_dir / "report" / "gate_verdict.json", {"passed": True, "reasons": []})
+
+            load_report(run_dir)["iterations"] = 99
+            load_gate_verdict(run_dir)["reasons"].append("mutated")
+            self.assertEqual(load_report(run_dir)["iterations"], 1)
+            self.assertEqual(load_gate_verdict(run_dir)["reasons"], [])
+
+            write_json(run_dir / "report" / "summary.json", {"run_id": "run", "iterations": 2, "rewritten": True})
+            self.assertEqual(load_report(run_dir)["iterations"], 2)
+
     def test_engine_template_export(self) -> None:
         engines = supported_engine_templates()
         self.assertIn("vcformal", engines)
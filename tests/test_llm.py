@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import gc
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from formalchip.llm import CommandLLM
+from formalchip.models import IterationFeedback
+from formalchip.synthesis import SynthesisInputs
+
+_WORKER = """
+import json, os, sys
+for n, line in enumerate(sys.stdin, 1):
+    req = json.loads(line)
+    cand = {"prop_id": f"p{n}", "name": f"{req['mode']}_{os.getpid()}", "body": "1;"}
+    sys.stdout.write(json.dumps({"candidates": [cand]}) + "\\n")
+    sys.stdout.flush()
+"""
+_HUNG_WORKER = "import sys, time\nsys.stdin.readline()\ntime.sleep(60)\n"
+_CRASHING_WORKER = "import sys\nsys.stdin.readline()\nsys.stderr.write('model unavailable\\n')\nsys.exit(1)\n"
+
+
+class CommandLLMTests(unittest.TestCase):
+    def test_persistent_worker_serves_every_call(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            script = Path(td) / "worker.py"
+            script.write_text(_WORKER, encoding="utf-8")
+            inputs = SynthesisInputs(clock="clk", reset="rst_n", reset_active_low=True, known_signals={"req"})
+
+            llm = CommandLLM(f"{sys.executable} {script}", persistent=True)
+            try:
+                first = llm.propose([], [], inputs)
+                feedback = IterationFeedback(status="fail", summary="status=fail")
+                second = llm.repair(first, feedback, [], [], inputs)
+            finally:
+                llm.close()
+
+            self.assertEqual(first[0].prop_id, "p1")
+            self.assertEqual(second[0].prop_id, "p2")
+            # Same worker pid in both responses: no process was started per call.
+            self.assertEqual(first[0].name.split("_")[1], second[0].name.split("_")[1])
+            self.assertTrue(second[0].name.startswith("repair_"))
+
+    def test_hung_or_crashing_worker_raises(self) -> None:
+        inputs = SynthesisInputs(clock="clk", reset="rst_n", reset_active_low=True, known_signals=set())
+        with tempfile.TemporaryDirectory() as td:
+            for body, expected in ((_HUNG_WORKER, "did not respond within 1s"), (_CRASHING_WORKER, "model unavailable")):
+                script = Path(td) / "worker.py"
+                script.write_text(body, encoding="utf-8")
+                llm = CommandLLM(f"{sys.executable} {script}", persistent=True, timeout_s=1)
+                try:
+                    with self.assertRaises(RuntimeError) as ctx:
+                        llm.propose([], [], inputs)
+                finally:
+                    llm.close()
+                self.assertIn(expected, str(ctx.exception))
+
+    def test_malformed_command_fails_cleanly(self) -> None:
+        unraisable: list[object] = []
+        with mock.patch.object(sys, "unraisablehook", unraisable.append):
+            with self.assertRaises(ValueError):
+                CommandLLM('echo "x', persistent=True)
+            gc.collect()
+        self.assertEqual(unraisable, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
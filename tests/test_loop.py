@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from formalchip.config import load_config
 from formalchip.loop import run_formalchip
@@ -74,6 +76,102 @@ path = "spec/regs.csv"
             assert state.evidence_pack is not None
             self.assertTrue(Path(state.evidence_pack).exists())
 
+    def test_identical_candidates_reuse_engine_verdict(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "rtl").mkdir()
+            (root / "spec").mkdir()
+            (root / "rtl" / "top.sv").write_text(
+                "module top(input logic clk, input logic rst_n, input logic req, output logic ack);\nendmodule\n",
+                encoding="utf-8",
+            )
+            (root / "spec" / "control.md").write_text("- If req then ack next cycle.\n", encoding="utf-8")
+            # Inconclusive every time: after the first coverage nudge, repair stops changing anything.
+            (root / "engine.py").write_text(
+                "from pathlib import Path\n"
+                "with (Path(__file__).parent / 'calls.txt').open('a') as f:\n"
+                "    f.write('x\\n')\n"
+                "print('STATUS: UNKNOWN')\n",
+                encoding="utf-8",
+            )
+            (root / "formalchip.toml").write_text(
+                f"""[project]
+name = "replay"
+rtl_files = ["rtl/top.sv"]
+top_module = "top"
+
+[llm]
+backend = "deterministic"
+
+[engine]
+kind = "questa"
+command = "{Path(sys.executable).as_posix()} {(root / 'engine.py').as_posix()}"
+
+[loop]
+max_iterations = 3
+workdir = ".formalchip/runs"
+
+[[specs]]
+kind = "text"
+path = "spec/control.md"
+""",
+                encoding="utf-8",
+            )
+
+            state = run_formalchip(load_config(root / "formalchip.toml"))
+
+            self.assertEqual(len(state.iterations), 3)
+            self.assertEqual((root / "calls.txt").read_text(encoding="utf-8").count("x"), 2)
+            # The replay links iteration 2's log into its own directory and says where it came from.
+            replay, source = state.iterations[2], state.iterations[1]
+            self.assertEqual(replay.source_iteration, 2)
+            self.assertIsNone(source.source_iteration)
+            self.assertEqual(Path(replay.engine_log).parent.name, "iter_03")
+            self.assertEqual(
+                Path(replay.engine_log).read_text(encoding="utf-8"),
+                Path(source.engine_log).read_text(encoding="utf-8"),
+            )
+            # Unchanged candidates are not re-serialized, but each iteration keeps its own file.
+            self.assertEqual(Path(replay.property_file).parent.name, "iter_03")
+            self.assertEqual(
+                Path(replay.property_file).read_bytes(),
+                Path(source.property_file).read_bytes(),
+            )
+            run_dir = Path(state.iterations[0].property_file).parent.parent
+            for it in state.iterations:
+                self.assertTrue((run_dir / f"iter_{it.iteration:02d}" / "properties.sv").is_file())
+
+    def test_llm_backend_closed_when_loop_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "rtl").mkdir()
+            (root / "spec").mkdir()
+            (root / "rtl" / "top.sv").write_text("module top(input logic clk);\nendmodule\n", encoding="utf-8")
+            (root / "spec" / "control.md").write_text("- If req then ack next cycle.\n", encoding="utf-8")
+            (root / "formalchip.toml").write_text(
+                """[project]
+name = "close"
+rtl_files = ["rtl/top.sv"]
+top_module = "top"
+
+[loop]
+workdir = ".formalchip/runs"
+
+[[specs]]
+kind = "text"
+path = "spec/control.md"
+""",
+                encoding="utf-8",
+            )
+            llm = mock.Mock()
+            llm.propose.return_value = []
+            with mock.patch("formalchip.loop.make_llm_backend", return_value=llm), mock.patch(
+                "formalchip.loop.make_engine", side_effect=RuntimeError("engine unavailable")
+            ):
+                with self.assertRaises(RuntimeError):
+                    run_formalchip(load_config(root / "formalchip.toml"))
+            llm.close.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from formalchip.config import SpecInput
 from formalchip.spec import parse_ipxact, parse_register_csv, parse_rule_table_csv, parse_text_spec
+from formalchip.spec_ingest import load_spec_clauses
 
 
 class SpecIngestTests(unittest.TestCase):
@@ -59,6 +61,18 @@ class SpecIngestTests(unittest.TestCase):
             self.assertEqual(len(clauses), 1)
             self.assertIn("then ack", clauses[0].text.lower())
 
+    def test_cached_clauses_are_not_shared_between_loads(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "regs.csv"
+            p.write_text("name,address,width,reset,access\nSTATUS,0x00,32,0x0,ro\n", encoding="utf-8")
+            spec = SpecInput(kind="register_csv", path=p)
+            first = load_spec_clauses([spec])
+            first[0].metadata["reset"] = "0xff"
+
+            second = load_spec_clauses([spec])
+            self.assertEqual(second[0].metadata["reset"], "0x0")
+            self.assertIsNot(second[0], first[0])
+
 
 if __name__ == "__main__":
     unittest.main()
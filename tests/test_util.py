@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from formalchip import util
+
+_DOCUMENTS = [
+    {"run_id": "r1", "iterations": [{"n": 1, "ok": True, "ratio": 0.25}], "note": None, "empty": {}, "rows": []},
+    {"spec": "Zählerüberlauf → reset", "ctl": "\x7f\x01\t"},
+    {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")},
+    {"big": 1e16, "small": 1e-5, "huge": 1.5e300, "neg": -0.0, "edge": 1e-4, "near": 9999999999999998.0},
+    {"ids": (1, 2, 3), "wide": 1 << 70},
+    {10: "ten", 9: "nine"},
+]
+
+
+class WriteJsonTests(unittest.TestCase):
+    def test_output_matches_stdlib_encoder(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            for n, doc in enumerate(_DOCUMENTS):
+                path = Path(td) / f"doc{n}.json"
+                util.write_json(path, doc)
+                expected = json.dumps(doc, indent=2, sort_keys=True) + "\n"
+                self.assertEqual(path.read_bytes(), expected.encode("utf-8"), doc)
+
+                with mock.patch.object(util, "_orjson", None):
+                    util.write_json(path, doc)
+                self.assertEqual(path.read_bytes(), expected.encode("utf-8"), doc)
+
+
+class ParseFileCachedTests(unittest.TestCase):
+    def test_reuses_unchanged_parse_and_hands_out_copies(self) -> None:
+        calls: list[tuple[Path, str]] = []
+
+        def parse(path: Path, mode: str) -> dict[str, list[str]]:
+            calls.append((path, mode))
+            return {"lines": path.read_text(encoding="utf-8").split()}
+
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "input.txt"
+            path.write_text("a b", encoding="utf-8")
+
+            first = util.parse_file_cached(path, parse, "x")
+            first["lines"].append("mutated")
+            second = util.parse_file_cached(path, parse, "x")
+            self.assertEqual(second, {"lines": ["a", "b"]})
+            self.assertEqual(len(calls), 1)
+
+            # Different arguments or a rewritten file parse again.
+            util.parse_file_cached(path, parse, "y")
+            path.write_text("a b c", encoding="utf-8")
+            third = util.parse_file_cached(path, parse, "y")
+            self.assertEqual(third, {"lines": ["a", "b", "c"]})
+            self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()